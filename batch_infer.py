@@ -0,0 +1,162 @@
+# batch_infer.py
+# 여러 장의 이미지(개별 파일 또는 ZIP)를 스트리밍으로 디코딩하고
+# learner.dls.test_dl / learner.get_preds 로 배치 추론합니다.
+import time
+import zipfile
+from io import BytesIO
+from typing import Any, Callable, Iterable, Iterator
+
+import numpy as np
+import pandas as pd
+from PIL import Image
+
+from image_ingest import ingest
+from preprocess import PreprocessSpec
+
+IMAGE_EXTS = (".jpg", ".jpeg", ".png", ".webp", ".tif", ".tiff", ".bmp")
+
+
+def _is_image_name(name: str) -> bool:
+    base = name.rsplit("/", 1)[-1]
+    return not base.startswith(".") and base.lower().endswith(IMAGE_EXTS)
+
+
+def _decode(b: bytes, spec: PreprocessSpec | None) -> Image.Image:
+    return ingest(b, spec, preview_max=None).image
+
+
+def _zip_members(zf: zipfile.ZipFile) -> list[zipfile.ZipInfo]:
+    return [zi for zi in zf.infolist()
+            if not zi.is_dir() and "__MACOSX/" not in zi.filename and _is_image_name(zi.filename)]
+
+
+def count_images(files: Iterable[Any]) -> int:
+    """업로드 목록에 들어있는 이미지 수 (ZIP은 목차만 읽음)."""
+    n = 0
+    for f in files:
+        if f.name.lower().endswith(".zip"):
+            f.seek(0)
+            try:
+                with zipfile.ZipFile(f) as zf:
+                    n += len(_zip_members(zf))
+            except (zipfile.BadZipFile, OSError):
+                n += 1   # 오류 행 하나
+            f.seek(0)
+        elif _is_image_name(f.name):
+            n += 1
+    return n
+
+
+def iter_images(
+    files: Iterable[Any], spec: PreprocessSpec | None = None,
+) -> Iterator[tuple[str, Image.Image | None, str | None]]:
+    """(이름, PIL 이미지, 오류 메시지)를 하나씩 생성.
+
+    ZIP은 한 번에 한 항목만 읽어서 디코딩하므로 아카이브 전체를 펼치지 않습니다.
+    spec을 주면 모델 입력 크기로 축소 디코딩합니다 (image_ingest).
+    디코딩에 실패한 항목(열 수 없는 ZIP 포함)은 이미지 대신 오류 메시지를 돌려줍니다.
+    """
+    for f in files:
+        if f.name.lower().endswith(".zip"):
+            f.seek(0)
+            try:
+                zf = zipfile.ZipFile(f)
+            except (zipfile.BadZipFile, OSError) as e:
+                yield f.name, None, f"invalid zip: {e}"
+                continue
+            with zf:
+                for zi in _zip_members(zf):
+                    name = f"{f.name}/{zi.filename}"
+                    try:
+                        with zf.open(zi) as fh:
+                            yield name, _decode(fh.read(), spec), None
+                    except Exception as e:
+                        yield name, None, str(e)
+        elif _is_image_name(f.name):
+            try:
+                yield f.name, _decode(f.getvalue(), spec), None
+            except Exception as e:
+                yield f.name, None, str(e)
+
+
+def _chunks(it: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    buf = []
+    for x in it:
+        buf.append(x)
+        if len(buf) >= size:
+            yield buf
+            buf = []
+    if buf:
+        yield buf
+
+
+def predict_batch(learner, images: list[Image.Image], batch_size: int) -> np.ndarray:
+    """PIL 이미지 리스트를 한 번의 test_dl/get_preds로 추론해 (N, C) 확률 배열 반환."""
+    from fastai.vision.all import PILImage
+    dl = learner.dls.test_dl([PILImage.create(im) for im in images], bs=batch_size)
+    with learner.no_bar():
+        probs, _ = learner.get_preds(dl=dl)
+    return probs.numpy()
+
+
+def classify_files(
+    engine,
+    files: Iterable[Any],
+    batch_size: int = 32,
+    progress: Callable[[int, float], None] | None = None,
+) -> tuple[pd.DataFrame, dict[str, float]]:
+    """업로드 파일/ZIP 전체를 배치 추론.
+
+    engine은 labels, spec, predict_batch(list[PIL]) -> (N, C)를 가진 객체 (inference_engine 참고).
+    progress(처리한 이미지 수, 누적 images/sec) 콜백이 배치마다 호출됩니다.
+    반환: (파일별 예측 + 라벨별 확률 DataFrame, 처리 통계)
+    """
+    labels = list(engine.labels)
+    rows: list[dict[str, Any]] = []
+    done, infer_s = 0, 0.0
+    t0 = time.perf_counter()
+    for chunk in _chunks(iter_images(files, getattr(engine, "spec", None)), batch_size):
+        images = [im for _, im, _ in chunk if im is not None]
+        probs = np.empty((0, len(labels)), dtype=np.float32)
+        if images:
+            t = time.perf_counter()
+            probs = np.asarray(engine.predict_batch(images))
+            infer_s += time.perf_counter() - t
+        j = 0
+        for n, im, err in chunk:   # 업로드 순서 유지
+            if im is None:
+                rows.append({"file": n, "prediction": None, "error": err})
+                continue
+            p = probs[j]; j += 1
+            row = {"file": n, "prediction": labels[int(p.argmax())], "error": None}
+            row.update({lbl: float(v) for lbl, v in zip(labels, p)})
+            rows.append(row)
+        done += len(chunk)
+        if progress is not None:
+            progress(done, done / max(time.perf_counter() - t0, 1e-9))
+    total_s = time.perf_counter() - t0
+    n_ok = sum(1 for r in rows if r["error"] is None)
+    df = pd.DataFrame(rows, columns=["file", "prediction", *labels, "error"])
+    stats = {
+        "images": float(n_ok),
+        "failed": float(len(rows) - n_ok),
+        "total_sec": total_s,
+        "infer_sec": infer_s,
+        "images_per_sec": n_ok / total_s if total_s > 0 else 0.0,
+        "infer_images_per_sec": n_ok / infer_s if infer_s > 0 else 0.0,
+    }
+    return df, stats
+
+
+def to_csv_bytes(df: pd.DataFrame) -> bytes:
+    return df.to_csv(index=False).encode("utf-8-sig")
+
+
+def to_parquet_bytes(df: pd.DataFrame) -> bytes | None:
+    """pyarrow/fastparquet이 없으면 None."""
+    buf = BytesIO()
+    try:
+        df.to_parquet(buf, index=False)
+    except ImportError:
+        return None
+    return buf.getvalue()
@@ -0,0 +1,108 @@
+# benchmarks/bench_ingest.py
+# 업로드 이미지 디코딩 경로 비교: 기존(load_pil_from_bytes + np.array + PILImage.create) vs image_ingest
+# 큰 JPEG/PNG/TIFF/WebP를 만들어 디코딩 지연(ms)과 요청당 최대 메모리 증가량(MB)을 측정합니다.
+# 최대 메모리는 케이스마다 새 프로세스에서 /proc/self/status의 VmHWM으로 잽니다 (Linux 전용).
+#
+#   python benchmarks/bench_ingest.py --size 4032x3024 --target 224
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from io import BytesIO
+from pathlib import Path
+
+import numpy as np
+from PIL import Image, ImageOps
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from image_ingest import ingest  # noqa: E402
+from metrics import reset_peak_rss, vm_kb  # noqa: E402
+from preprocess import PreprocessSpec, resize_like_fastai  # noqa: E402
+
+FORMATS = {"jpeg": ".jpg", "png": ".png", "tiff": ".tiff", "webp": ".webp"}
+
+
+def make_image(w: int, h: int, seed: int = 0) -> Image.Image:
+    """부드러운 그라디언트 + 노이즈 (실사진과 비슷한 압축률)."""
+    rng = np.random.default_rng(seed)
+    yy, xx = np.mgrid[0:h, 0:w]
+    base = np.stack([xx * 255 // w, yy * 255 // h, (xx + yy) * 255 // (w + h)], axis=-1)
+    noise = rng.integers(-12, 12, (h, w, 3))
+    return Image.fromarray(np.clip(base + noise, 0, 255).astype(np.uint8))
+
+
+def legacy_path(b: bytes, spec: PreprocessSpec) -> Image.Image:
+    pil = Image.open(BytesIO(b))
+    pil = ImageOps.exif_transpose(pil)
+    if pil.mode != "RGB": pil = pil.convert("RGB")
+    arr = np.array(pil)                              # np.array(pil_img)
+    model_in = Image.fromarray(arr)                  # PILImage.create(ndarray)
+    return resize_like_fastai(model_in, spec)        # learner의 Resize
+
+
+def fast_path(b: bytes, spec: PreprocessSpec) -> Image.Image:
+    return ingest(b, spec).image
+
+
+def child(path: str, mode: str, target: int, reps: int) -> None:
+    b = Path(path).read_bytes()
+    spec = PreprocessSpec(size=(target, target))
+    fn = legacy_path if mode == "legacy" else fast_path
+    reset_peak_rss()                                 # VmHWM(최대 RSS)를 현재값으로 초기화
+    base_kb = vm_kb("VmRSS")
+    times = []
+    for _ in range(reps):
+        t = time.perf_counter()
+        out = fn(b, spec)
+        times.append((time.perf_counter() - t) * 1000)
+    peak_kb = vm_kb("VmHWM")
+    print(json.dumps({
+        "ms": float(np.median(times)),
+        "peak_mb": (peak_kb - base_kb) / 1024,
+        "out_size": list(out.size),
+    }))
+
+
+def run_case(path: Path, mode: str, target: int, reps: int) -> dict:
+    out = subprocess.run(
+        [sys.executable, __file__, "--child", str(path), mode, str(target), str(reps)],
+        check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main(argv: list[str] | None = None) -> int:
+    if argv is None and len(sys.argv) > 1 and sys.argv[1] == "--child":
+        p, mode, target, reps = sys.argv[2:6]
+        child(p, mode, int(target), int(reps))
+        return 0
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--size", default="4032x3024")
+    ap.add_argument("--target", type=int, default=224)
+    ap.add_argument("--reps", type=int, default=3)
+    ap.add_argument("--formats", default=",".join(FORMATS))
+    args = ap.parse_args(argv)
+    w, h = (int(x) for x in args.size.lower().split("x"))
+
+    img = make_image(w, h)
+    spec = PreprocessSpec(size=(args.target, args.target))
+    print(f"{w}x{h} -> {args.target}px")
+    print(f"{'format':<8}{'MB':>7}{'legacy ms':>12}{'fast ms':>10}{'legacy MB':>12}{'fast MB':>10}{'mean|Δpx|':>11}")
+    with tempfile.TemporaryDirectory() as td:
+        for fmt in args.formats.split(","):
+            path = Path(td) / f"img{FORMATS[fmt]}"
+            img.save(path, format=fmt.upper(), **({"quality": 90} if fmt in ("jpeg", "webp") else {}))
+            b = path.read_bytes()
+            old = run_case(path, "legacy", args.target, args.reps)
+            new = run_case(path, "fast", args.target, args.reps)
+            diff = np.abs(np.asarray(legacy_path(b, spec), dtype=np.int16)
+                          - np.asarray(fast_path(b, spec), dtype=np.int16)).mean()
+            print(f"{fmt:<8}{len(b) / 2**20:>7.1f}{old['ms']:>12.1f}{new['ms']:>10.1f}"
+                  f"{old['peak_mb']:>12.1f}{new['peak_mb']:>10.1f}{diff:>11.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,64 @@
+# benchmarks/bench_payload.py
+# 앱 한 번 재실행(rerun)으로 브라우저에 보내는 요소 페이로드(protobuf 바이트)를 라벨별로 측정합니다.
+# streamlit.testing(AppTest)으로 앱을 실행하므로 로컬 모델 파일과 샘플 이미지가 필요합니다.
+#
+#   python benchmarks/bench_payload.py --model model.pkl --image sample.jpg
+import argparse
+import sys
+from pathlib import Path
+
+from streamlit.testing.v1 import AppTest
+
+APP = Path(__file__).resolve().parents[1] / "streamlit_app.py"
+
+
+def _leaves(node):
+    children = getattr(node, "children", None)
+    if children is None:
+        yield node
+        return
+    for child in children.values():
+        yield from _leaves(child)
+
+
+def element_bytes(at: AppTest) -> dict[str, int]:
+    """요소 종류별 protobuf 직렬화 크기 합."""
+    sizes: dict[str, int] = {}
+    for el in _leaves(at._tree):
+        proto = getattr(el, "proto", None)
+        if proto is None:
+            continue
+        kind = type(el).__name__.lower()
+        sizes[kind] = sizes.get(kind, 0) + proto.ByteSize()
+    return sizes
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--model", required=True)
+    ap.add_argument("--image", required=True)
+    ap.add_argument("--timeout", type=float, default=120)
+    args = ap.parse_args(argv)
+
+    at = AppTest.from_file(str(APP), default_timeout=args.timeout)
+    at.secrets["MODEL_PATH"] = args.model
+    at.secrets["MODEL_BACKGROUND_LOAD"] = False   # 첫 실행에서 바로 예측해야 결과 패널(selectbox)이 생김
+    at.session_state["img_bytes"] = Path(args.image).read_bytes()
+    at.session_state["img_key"] = "bench"
+    at.run()
+    if at.exception:
+        print(at.exception, file=sys.stderr)
+        return 1
+
+    select = at.selectbox[0]
+    print(f"{'label':<20}{'total B':>10}  by element")
+    for label in select.options:
+        select.set_value(label).run()
+        sizes = element_bytes(at)
+        detail = ", ".join(f"{k}={v}" for k, v in sorted(sizes.items(), key=lambda kv: -kv[1])[:4])
+        print(f"{label:<20}{sum(sizes.values()):>10}  {detail}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
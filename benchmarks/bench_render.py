@@ -0,0 +1,98 @@
+# benchmarks/bench_render.py
+# 확률 패널 렌더링 비교: 라벨마다 st.markdown 하나(cards) vs 상위 k개 + 기타 한 블록(topk)
+# 클래스 수(vocab)를 바꿔 가며 HTML 생성 시간, 앱 안 렌더링 시간, rerun 시간, 페이로드(protobuf 바이트)를 잽니다.
+# 모델 없이 streamlit.testing(AppTest)으로 확률 패널만 그리는 작은 앱을 실행합니다.
+#
+#   python benchmarks/bench_render.py --vocab 3,100,1000,10000 --k 10
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+from streamlit.testing.v1 import AppTest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+import render  # noqa: E402
+from bench_payload import element_bytes  # noqa: E402
+
+MODES = ("cards", "topk")
+
+
+def make_probs(n: int, seed: int = 0) -> tuple[list[str], np.ndarray]:
+    """실제 분류기처럼 몇 개 클래스에 확률이 몰린 분포."""
+    rng = np.random.default_rng(seed)
+    return [f"class_{i:05d}" for i in range(n)], rng.dirichlet(np.full(n, 0.05)).astype(np.float32)
+
+
+def build(mode: str, labels: list[str], probs: np.ndarray, k: int) -> list[str]:
+    """st.markdown에 넘길 HTML 목록 (앱과 같은 경로)."""
+    pred = labels[int(probs.argmax())]
+    if mode == "cards":
+        return [render.prob_card_html(lbl, p, lbl == pred) for lbl, p in render.sorted_probs(labels, probs)]
+    return [render.prob_panel_html(labels, probs, k, pred)]
+
+
+def _app(root: str, mode: str, n: int, k: int) -> None:
+    import sys
+    import time
+    sys.path.insert(0, root)
+    sys.path.insert(0, root + "/benchmarks")
+    import streamlit as st
+    from bench_render import build, make_probs
+
+    labels, probs = make_probs(n)
+    t = time.perf_counter()
+    for block in build(mode, labels, probs, k):
+        st.markdown(block, unsafe_allow_html=True)
+    st.session_state["render_ms"] = (time.perf_counter() - t) * 1000
+
+
+def measure(mode: str, n: int, k: int, reps: int, timeout: float) -> dict:
+    labels, probs = make_probs(n)
+    build(mode, labels, probs, k)
+    build_ms = []
+    for _ in range(reps):
+        t = time.perf_counter()
+        build(mode, labels, probs, k)
+        build_ms.append((time.perf_counter() - t) * 1000)
+
+    render_ms, rerun_ms = [], []
+    at = AppTest.from_function(_app, args=(str(ROOT), mode, n, k), default_timeout=timeout)
+    for _ in range(reps):
+        t = time.perf_counter()
+        at.run()
+        rerun_ms.append((time.perf_counter() - t) * 1000)
+        if at.exception:
+            raise RuntimeError(at.exception[0].value)
+        render_ms.append(at.session_state["render_ms"])
+    return {
+        "elements": len(at.markdown),
+        "build_ms": float(np.median(build_ms)),
+        "render_ms": float(np.median(render_ms)),
+        "rerun_ms": float(np.median(rerun_ms)),
+        "payload": sum(element_bytes(at).values()),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--vocab", default="3,30,100,300,1000,3000,10000")
+    ap.add_argument("--k", type=int, default=10)
+    ap.add_argument("--reps", type=int, default=3)
+    ap.add_argument("--timeout", type=float, default=300)
+    args = ap.parse_args(argv)
+
+    print(f"top-k = {args.k}")
+    print(f"{'vocab':>6}  {'mode':<6}{'elements':>9}{'build ms':>10}{'render ms':>11}{'rerun ms':>10}{'payload KB':>12}")
+    for n in (int(x) for x in args.vocab.split(",")):
+        for mode in MODES:
+            r = measure(mode, n, args.k, args.reps, args.timeout)
+            print(f"{n:>6}  {mode:<6}{r['elements']:>9}{r['build_ms']:>10.2f}{r['render_ms']:>11.1f}"
+                  f"{r['rerun_ms']:>10.1f}{r['payload'] / 1024:>12.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,57 @@
+# benchmarks/compare_engines.py
+# fastai / torchscript / onnx 백엔드의 learner.predict 대비 일치도와 CPU 지연·처리량 비교
+#
+#   python benchmarks/compare_engines.py --model model.pkl --images ./samples --threads 4
+#   (--images를 생략하면 무작위 합성 이미지 사용)
+import argparse
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+import inference_engine as ie  # noqa: E402
+
+
+def load_images(folder: str | None, n: int, seed: int = 0) -> list[Image.Image]:
+    if folder:
+        exts = (".jpg", ".jpeg", ".png", ".webp", ".tif", ".tiff")
+        paths = sorted(p for p in Path(folder).rglob("*") if p.suffix.lower() in exts)[:n]
+        return [Image.open(p).convert("RGB") for p in paths]
+    rng = np.random.default_rng(seed)
+    return [Image.fromarray(rng.integers(0, 256, (480, 640, 3), dtype=np.uint8)) for _ in range(n)]
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--model", default=os.environ.get("MODEL_PATH", "model.pkl"))
+    ap.add_argument("--images", default=None, help="이미지 폴더 (없으면 합성 이미지)")
+    ap.add_argument("-n", type=int, default=64)
+    ap.add_argument("--batch-size", type=int, default=32)
+    ap.add_argument("--threads", type=int, default=None)
+    ap.add_argument("--backends", default="fastai,torchscript,torchscript+int8,onnx,onnx+int8")
+    args = ap.parse_args(argv)
+
+    from fastai.vision.all import load_learner
+    learner = load_learner(args.model, cpu=True)
+    images = load_images(args.images, args.n)
+
+    print(f"{'backend':<18}{'top1':>8}{'max|Δp|':>10}{'p50 ms':>10}{'p95 ms':>10}{'img/s':>10}")
+    for name in args.backends.split(","):
+        backend, _, q = name.partition("+")
+        try:
+            engine = ie.build_engine(learner, backend, quantize=(q == "int8"), threads=args.threads)
+        except ImportError as e:
+            print(f"{name:<18}skipped ({e})")
+            continue
+        eq = ie.check_equivalence(learner, engine, images)
+        lat = ie.measure_latency(engine, images, batch_size=args.batch_size)
+        print(f"{name:<18}{eq['top1_agreement']:>8.3f}{eq['max_prob_delta']:>10.2e}"
+              f"{lat['single_ms_p50']:>10.2f}{lat['single_ms_p95']:>10.2f}{lat['batch_images_per_sec']:>10.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,104 @@
+# benchmarks/load_test.py
+# N개의 동시 세션(스레드)이 각각 요청을 보내는 상황을 흉내 내어
+# 기존 단건 경로(engine.predict를 세션마다 직접 호출)와 마이크로배치 스케줄러를 비교합니다.
+#
+#   python benchmarks/load_test.py --model model.pkl --sessions 16 --requests 20 --backend fastai
+import argparse
+import sys
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+import inference_engine as ie  # noqa: E402
+from inference_scheduler import BatchedEngine, QueueFullError  # noqa: E402
+
+
+def run_load(predict, images: list[Image.Image], sessions: int, requests: int, think_ms: float) -> dict:
+    lat: list[float] = []
+    errors = [0]
+    rejected = [0]
+    lock = threading.Lock()
+    start = threading.Barrier(sessions + 1)
+
+    def session(sid: int) -> None:
+        rng = np.random.default_rng(sid)
+        start.wait()
+        for _ in range(requests):
+            im = images[int(rng.integers(len(images)))]
+            t = time.perf_counter()
+            try:
+                predict(im)
+            except QueueFullError:
+                with lock:
+                    rejected[0] += 1
+                continue
+            except Exception:
+                with lock:
+                    errors[0] += 1
+                continue
+            with lock:
+                lat.append((time.perf_counter() - t) * 1000)
+            if think_ms:
+                time.sleep(rng.exponential(think_ms) / 1000)
+
+    threads = [threading.Thread(target=session, args=(i,)) for i in range(sessions)]
+    for th in threads:
+        th.start()
+    start.wait()
+    t0 = time.perf_counter()
+    for th in threads:
+        th.join()
+    wall = time.perf_counter() - t0
+    arr = np.array(lat) if lat else np.array([np.nan])
+    return {
+        "ok": len(lat),
+        "errors": errors[0],
+        "rejected": rejected[0],
+        "p50": float(np.percentile(arr, 50)),
+        "p95": float(np.percentile(arr, 95)),
+        "p99": float(np.percentile(arr, 99)),
+        "rps": len(lat) / wall if wall > 0 else 0.0,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--model", default="model.pkl")
+    ap.add_argument("--backend", default="fastai", choices=ie.BACKENDS)
+    ap.add_argument("--sessions", type=int, default=16)
+    ap.add_argument("--requests", type=int, default=20, help="세션당 요청 수")
+    ap.add_argument("--think-ms", type=float, default=0.0, help="요청 사이 평균 대기(지수분포)")
+    ap.add_argument("--max-batch", type=int, default=16)
+    ap.add_argument("--max-wait-ms", type=float, default=5.0)
+    ap.add_argument("--max-queue", type=int, default=256)
+    ap.add_argument("--threads", type=int, default=None)
+    args = ap.parse_args(argv)
+
+    from fastai.vision.all import load_learner
+    learner = load_learner(args.model, cpu=True)
+    engine = ie.build_engine(learner, args.backend, threads=args.threads)
+    rng = np.random.default_rng(0)
+    w, h = engine.spec.size or (224, 224)
+    images = [Image.fromarray(rng.integers(0, 256, (h, w, 3), dtype=np.uint8)) for _ in range(32)]
+
+    batched = BatchedEngine(engine, args.max_batch, args.max_wait_ms, args.max_queue)
+    paths = {"per-call": engine.predict, "micro-batch": batched.predict}
+    print(f"{args.backend}: {args.sessions} sessions x {args.requests} requests")
+    print(f"{'path':<13}{'ok':>6}{'err':>5}{'rej':>5}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'req/s':>9}")
+    for name, predict in paths.items():
+        predict(images[0])   # 워밍업
+        r = run_load(predict, images, args.sessions, args.requests, args.think_ms)
+        print(f"{name:<13}{r['ok']:>6}{r['errors']:>5}{r['rejected']:>5}"
+              f"{r['p50']:>9.1f}{r['p95']:>9.1f}{r['p99']:>9.1f}{r['rps']:>9.1f}")
+    s = batched.scheduler.stats()
+    print(f"scheduler: {int(s['batches'])} batches, avg batch {s['avg_batch']:.1f}, rejected {int(s['rejected'])}")
+    batched.scheduler.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,168 @@
+# benchmarks/run_suite.py
+# 추론 경로 회귀 확인용 오프라인 벤치마크 (Streamlit / 네트워크 불필요).
+# - 작은 합성 fastai learner를 임시 폴더에서 학습/export/load_learner
+# - 여러 해상도 x 포맷의 합성 이미지 코퍼스
+# - 케이스마다 ingest 단계, 백엔드별 predict, 결과 HTML 렌더링을 RequestMetrics로 측정해 p50/p95(ms) 출력
+#
+#   python benchmarks/run_suite.py --out bench.json
+#   python benchmarks/run_suite.py --baseline bench.json --threshold 0.25   # 느려지면 종료 코드 1
+import argparse
+import json
+import platform
+import sys
+import tempfile
+import warnings
+from io import BytesIO
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+import render  # noqa: E402
+from bench_ingest import make_image  # noqa: E402
+from image_ingest import ingest  # noqa: E402
+from metrics import RequestMetrics  # noqa: E402
+
+SIZES = ["320x240", "1280x960", "4032x3024"]
+FORMATS = {"jpeg": {"quality": 90}, "png": {}, "webp": {"quality": 90}, "tiff": {}}
+COLORS = {"red": (220, 40, 40), "green": (40, 200, 60), "blue": (40, 60, 220)}
+
+
+def make_learner(workdir: Path, size: int = 64, epochs: int = 3):
+    """색으로 구분되는 3클래스 폴더 데이터셋으로 작은 CNN을 학습하고 export -> load_learner로 되읽음."""
+    from fastai.vision.all import ImageDataLoaders, Learner, Resize, load_learner, nn
+
+    rng = np.random.default_rng(0)
+    root = workdir / "ds"
+    for name, col in COLORS.items():
+        (root / name).mkdir(parents=True, exist_ok=True)
+        for i in range(8):
+            arr = np.clip(np.array(col) + rng.integers(-40, 40, (size, size, 3)), 0, 255).astype(np.uint8)
+            Image.fromarray(arr).save(root / name / f"{i}.jpg")
+    dls = ImageDataLoaders.from_folder(root, valid_pct=0.25, item_tfms=Resize(size), bs=8, num_workers=0, seed=0)
+    model = nn.Sequential(
+        nn.Conv2d(3, 8, 3, 2, 1), nn.ReLU(), nn.AdaptiveAvgPool2d(1), nn.Flatten(), nn.Linear(8, len(COLORS)),
+    )
+    learner = Learner(dls, model)
+    with learner.no_bar(), learner.no_logging():
+        learner.fit(epochs, 3e-2)
+    path = workdir / "model.pkl"
+    learner.export(path)
+    return load_learner(path, cpu=True)
+
+
+def make_corpus(sizes: list[str], formats: list[str]) -> dict[str, bytes]:
+    out = {}
+    for s in sizes:
+        w, h = (int(x) for x in s.lower().split("x"))
+        img = make_image(w, h)
+        for fmt in formats:
+            buf = BytesIO()
+            img.save(buf, format=fmt.upper(), **FORMATS[fmt])
+            out[f"{s}/{fmt}"] = buf.getvalue()
+    return out
+
+
+def render_result(labels: list[str], probs, pred: str) -> int:
+    """앱과 같은 결과 패널 HTML을 만들고 총 길이(문자) 반환."""
+    return len(render.prediction_box_html(pred)) + len(render.prob_panel_html(labels, probs, 10, pred))
+
+
+def run_case(b: bytes, engines: dict, reps: int) -> dict[str, dict[str, float]]:
+    spec = next(iter(engines.values())).spec
+    per: dict[str, list[float]] = {}
+    for i in range(reps + 1):   # 첫 회는 워밍업
+        req = RequestMetrics("bench", track_memory=False)
+        timings: dict[str, float] = {}
+        ing = ingest(b, spec, timings=timings)
+        req.add_all(timings, prefix="ingest.")
+        for name, engine in engines.items():
+            with req.stage(f"predict.{name}"):
+                pred, _, probs = engine.predict(ing.image)
+        with req.stage("render"):
+            render_result(engine.labels, probs, str(pred))
+        if i == 0:
+            continue
+        rec = req.finish()
+        for k, v in [*rec["stages"].items(), ("total", rec["total_ms"])]:
+            per.setdefault(k, []).append(v)
+    return {
+        k: {"p50": round(float(np.percentile(v, 50)), 3), "p95": round(float(np.percentile(v, 95)), 3)}
+        for k, v in per.items()
+    }
+
+
+def compare(result: dict, baseline: dict, threshold: float, min_ms: float) -> list[str]:
+    """baseline 대비 p50이 (1 + threshold)배 이상 그리고 min_ms 이상 느려진 단계 목록."""
+    bad = []
+    for case, stages in result["cases"].items():
+        for stage, cur in stages.items():
+            old = baseline.get("cases", {}).get(case, {}).get(stage)
+            if old is None:
+                continue
+            if cur["p50"] > old["p50"] * (1 + threshold) and cur["p50"] - old["p50"] > min_ms:
+                bad.append(f"{case} {stage}: {old['p50']:.2f} -> {cur['p50']:.2f} ms")
+    return bad
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--sizes", default=",".join(SIZES))
+    ap.add_argument("--formats", default=",".join(FORMATS))
+    ap.add_argument("--backends", default="fastai,torchscript")
+    ap.add_argument("--reps", type=int, default=5)
+    ap.add_argument("--threads", type=int, default=1, help="torch 스레드 수 (결과 재현성을 위해 기본 1)")
+    ap.add_argument("--out", default=None, help="결과 JSON 경로 (없으면 stdout)")
+    ap.add_argument("--baseline", default=None, help="비교할 이전 결과 JSON")
+    ap.add_argument("--threshold", type=float, default=0.25, help="허용 p50 증가율")
+    ap.add_argument("--min-ms", type=float, default=1.0, help="이보다 작은 증가는 무시(ms)")
+    args = ap.parse_args(argv)
+
+    warnings.filterwarnings("ignore")
+    import torch
+    import inference_engine as ie
+
+    torch.manual_seed(0)
+    ie.set_threads(args.threads)
+    with tempfile.TemporaryDirectory() as td:
+        learner = make_learner(Path(td))
+        engines = {
+            name: ie.build_engine(learner, name, export_dir=str(Path(td) / "engine"))
+            for name in args.backends.split(",")
+        }
+        corpus = make_corpus(args.sizes.split(","), args.formats.split(","))
+        cases = {}
+        for case, b in corpus.items():
+            cases[case] = run_case(b, engines, args.reps)
+            print(f"{case:<16}{len(b) / 2**20:>6.1f} MB  total p50 {cases[case]['total']['p50']:>8.1f} ms",
+                  file=sys.stderr)
+
+    result = {
+        "meta": {
+            "python": platform.python_version(),
+            "torch": torch.__version__,
+            "threads": args.threads,
+            "reps": args.reps,
+            "backends": list(engines),
+        },
+        "cases": cases,
+    }
+    text = json.dumps(result, indent=2)
+    if args.out:
+        Path(args.out).write_text(text + "\n")
+    else:
+        print(text)
+
+    if args.baseline:
+        bad = compare(result, json.loads(Path(args.baseline).read_text()), args.threshold, args.min_ms)
+        for line in bad:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if bad:
+            return 1
+        print("no regressions", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,107 @@
+# content_store.py
+# 라벨별 고정 콘텐츠(텍스트/이미지/동영상)를 디스크의 manifest + 에셋 파일로 관리합니다.
+# - manifest.json만 시작 시 읽고, 이미지 에셋은 선택된 라벨에 대해서만 지연 로드
+# - 이미지는 한 번만 디코딩해 썸네일로 줄이고 .thumbs/ 에 캐시 (st.image로 파일 서빙)
+#
+# manifest.json 형식:
+#   {"thumb_max_side": 480,
+#    "labels": [{"label": "neymar", "texts": [...], "images": ["assets/neymar/1.jpg" | "https://..."], "videos": [...]},
+#               {"index": 1, ...}]}
+#   "label"이 있으면 라벨명으로, 없으면 learner vocab의 "index" 위치로 매칭합니다.
+import hashlib
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from PIL import Image, ImageOps
+
+MAX_ITEMS = 3
+
+
+@dataclass
+class LabelContent:
+    texts: list[str] = field(default_factory=list)
+    images: list[str] = field(default_factory=list)   # 로컬 썸네일 경로 또는 원격 URL
+    videos: list[str] = field(default_factory=list)
+
+    def is_empty(self) -> bool:
+        return not (self.texts or self.images or self.videos)
+
+
+def _pick(lst) -> list[str]:
+    return [x for x in (lst or []) if isinstance(x, str) and x.strip()][:MAX_ITEMS]
+
+
+def _is_remote(ref: str) -> bool:
+    return ref.startswith(("http://", "https://", "data:"))
+
+
+class ContentStore:
+    def __init__(self, root: str | os.PathLike, thumb_dir: str | os.PathLike | None = None):
+        self.root = Path(root)
+        self.thumb_dir = Path(thumb_dir) if thumb_dir else self.root / ".thumbs"
+        manifest_path = self.root / "manifest.json"
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8")) if manifest_path.exists() else {}
+        self.thumb_max_side = int(manifest.get("thumb_max_side", 480))
+        self._by_label: dict[str, dict] = {}
+        self._by_index: dict[int, dict] = {}
+        for entry in manifest.get("labels", []):
+            if "label" in entry:
+                self._by_label[str(entry["label"])] = entry
+            elif "index" in entry:
+                self._by_index[int(entry["index"])] = entry
+        self._thumbs: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def _entry(self, label: str, labels: list[str]) -> dict:
+        if label in self._by_label:
+            return self._by_label[label]
+        if label in labels:
+            return self._by_index.get(labels.index(label), {})
+        return {}
+
+    def labels_with_content(self, labels: list[str]) -> list[str]:
+        """manifest에 항목이 있는 라벨 (labels 순서)."""
+        return [lbl for i, lbl in enumerate(labels) if lbl in self._by_label or i in self._by_index]
+
+    def thumbnail(self, ref: str) -> str | None:
+        """에셋 상대경로 -> 썸네일 파일 경로 (파일이 없으면 None). 원본이 바뀌지 않으면 다시 디코딩하지 않음."""
+        if _is_remote(ref):
+            return ref
+        with self._lock:
+            if ref in self._thumbs:
+                return self._thumbs[ref]
+            src = self.root / ref
+            if not src.is_file():
+                return None
+            with Image.open(src) as im:
+                # 이미 충분히 작은 JPEG은 재인코딩하지 않고 그대로 서빙
+                if im.format == "JPEG" and max(im.size) <= self.thumb_max_side and im.getexif().get(0x0112, 1) == 1:
+                    self._thumbs[ref] = str(src)
+                    return self._thumbs[ref]
+            stat = src.stat()
+            tag = hashlib.sha1(f"{ref}:{stat.st_mtime_ns}:{stat.st_size}:{self.thumb_max_side}".encode()).hexdigest()[:16]
+            dst = self.thumb_dir / f"{tag}.jpg"
+            if not dst.exists():
+                self.thumb_dir.mkdir(parents=True, exist_ok=True)
+                with Image.open(src) as im:
+                    im.draft("RGB", (self.thumb_max_side, self.thumb_max_side))
+                    im = ImageOps.exif_transpose(im)
+                    if im.mode != "RGB": im = im.convert("RGB")
+                    im.thumbnail((self.thumb_max_side, self.thumb_max_side))
+                    tmp = dst.with_suffix(".tmp")
+                    im.save(tmp, format="JPEG", quality=85, optimize=True)
+                os.replace(tmp, dst)
+            self._thumbs[ref] = str(dst)
+            return self._thumbs[ref]
+
+    def get(self, label: str, labels: list[str]) -> LabelContent:
+        """선택된 라벨의 콘텐츠. 이미지 썸네일은 이 시점에 처음 만들어짐."""
+        cfg = self._entry(label, labels)
+        return LabelContent(
+            texts=_pick(cfg.get("texts")),
+            images=[t for t in map(self.thumbnail, _pick(cfg.get("images"))) if t],
+            videos=_pick(cfg.get("videos")),
+        )
@@ -0,0 +1,105 @@
+# image_ingest.py
+# 업로드 바이트 -> (모델 입력 이미지, 미리보기 이미지) 빠른 경로.
+# - JPEG은 Image.draft로 DCT 단계에서 축소 디코딩 (1/2, 1/4, 1/8)
+# - 그 외 포맷은 디코딩 직후 Image.reduce(정수 배 박스 축소)
+# - 회전(EXIF)과 RGB 변환은 축소된 이미지에만 적용
+# - 축소는 가로세로 비율을 유지하며 두 변 모두 spec.min_decode_size 이상으로만 줄임
+# - spec.exact(내보내기 백엔드)면 learner의 검증 변환을 재현해 정확히 spec.size로 만들고,
+#   아니면(fastai 백엔드) 축소본을 그대로 넘겨 learner의 item_tfms가 crop/resize를 하도록 둠
+import time
+from dataclasses import dataclass
+from io import BytesIO
+
+from PIL import Image
+
+from preprocess import PreprocessSpec, resize_like_fastai
+
+PREVIEW_MAX_SIDE = 720
+
+# EXIF Orientation -> 보정 변환 (ImageOps.exif_transpose와 동일). 5~8은 가로/세로가 바뀜
+_TRANSPOSE = {
+    2: Image.Transpose.FLIP_LEFT_RIGHT,
+    3: Image.Transpose.ROTATE_180,
+    4: Image.Transpose.FLIP_TOP_BOTTOM,
+    5: Image.Transpose.TRANSPOSE,
+    6: Image.Transpose.ROTATE_270,
+    7: Image.Transpose.TRANSVERSE,
+    8: Image.Transpose.ROTATE_90,
+}
+_SWAP_ORIENTATIONS = (5, 6, 7, 8)
+_REDUCIBLE_MODES = ("RGB", "RGBA", "L", "LA")
+
+
+@dataclass
+class Ingested:
+    image: Image.Image          # 모델 입력 (spec.exact면 정확히 spec.size, 아니면 비율을 유지한 축소본)
+    preview: Image.Image | None  # st.image용 작은 이미지 (preview_max=None이면 생략)
+    orig_size: tuple[int, int]  # 회전 반영 전 원본 (w, h)
+    decode_ms: float
+
+
+def _needed_size(spec: PreprocessSpec | None, orig: tuple[int, int], preview_max: int | None) -> tuple[int, int]:
+    """모델 입력과 미리보기를 모두 만들 수 있는 최소 디코딩 크기."""
+    w, h = orig
+    if spec is None or spec.min_decode_size is None:   # 모델이 원본 크기를 그대로 쓰면 축소하지 않음
+        return w, h
+    s = min(1.0, preview_max / max(w, h)) if preview_max else 0.0
+    need_w, need_h = int(w * s), int(h * s)
+    tw, th = spec.min_decode_size
+    need_w, need_h = max(need_w, tw), max(need_h, th)
+    return max(need_w, 1), max(need_h, 1)
+
+
+def ingest(
+    b: bytes,
+    spec: PreprocessSpec | None = None,
+    preview_max: int | None = PREVIEW_MAX_SIDE,
+    timings: dict[str, float] | None = None,
+) -> Ingested:
+    """업로드 바이트를 축소 디코딩해 모델 입력과 미리보기를 만듦.
+
+    timings에 dict를 넘기면 단계별 시간(ms: decode, orient_rgb, resize, preview)을 기록합니다.
+    """
+    t0 = last = time.perf_counter()
+
+    def lap(name: str) -> None:
+        nonlocal last
+        now = time.perf_counter()
+        if timings is not None:
+            timings[name] = timings.get(name, 0.0) + (now - last) * 1000
+        last = now
+
+    pil = Image.open(BytesIO(b))
+    orig = pil.size
+    orientation = pil.getexif().get(0x0112, 1)
+    swap = orientation in _SWAP_ORIENTATIONS
+    # 필요한 크기는 회전 후 기준으로 계산한 뒤 원본 방향으로 되돌림
+    need_w, need_h = _needed_size(spec, orig[::-1] if swap else orig, preview_max)
+    if swap:
+        need_w, need_h = need_h, need_w
+
+    if pil.format == "JPEG":
+        pil.draft("RGB", (need_w, need_h))
+    factor = int(min(pil.width / need_w, pil.height / need_h))
+    if factor >= 2:
+        if pil.mode not in _REDUCIBLE_MODES:   # 팔레트/16비트 등은 reduce를 지원하지 않음
+            pil = pil.convert("RGB")
+        pil = pil.reduce(factor)
+    pil.load()
+    lap("decode")
+
+    if orientation in _TRANSPOSE:
+        pil = pil.transpose(_TRANSPOSE[orientation])
+    if pil.mode != "RGB": pil = pil.convert("RGB")
+    lap("orient_rgb")
+
+    model_img = resize_like_fastai(pil, spec) if spec is not None else pil
+    lap("resize")
+    preview = None
+    if preview_max:
+        preview = pil
+        if max(pil.size) > preview_max:
+            preview = pil.copy()
+            preview.thumbnail((preview_max, preview_max), Image.BILINEAR)
+    lap("preview")
+    return Ingested(model_img, preview, orig, (time.perf_counter() - t0) * 1000)
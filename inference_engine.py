@@ -0,0 +1,228 @@
+# inference_engine.py
+# fastai Learner 대신 쓸 수 있는 CPU 추론 백엔드.
+# - fastai     : 기존 learner.predict 그대로
+# - torchscript: 모델 + 정규화를 torch.jit.trace로 묶은 그래프 (선택적으로 동적 int8 양자화)
+# - onnx       : 같은 그래프를 ONNX로 내보내 onnxruntime으로 실행 (onnx/onnxruntime 필요)
+# 모든 엔진은 labels, spec(PreprocessSpec), predict(pil) -> (pred, pred_idx, probs), predict_batch(list[pil]) -> (N, C) 를 제공합니다.
+import copy
+import importlib.util
+import json
+import os
+import time
+
+import numpy as np
+import torch
+from torch import nn
+from PIL import Image
+
+from preprocess import PreprocessSpec, preprocess_spec, to_batch_array
+
+BACKENDS = ("fastai", "torchscript", "onnx")
+
+
+# ======================
+# 내보내기용 그래프
+# ======================
+class _ExportWrapper(nn.Module):
+    """(N, H, W, 3) uint8 입력 -> 정규화 -> 모델 -> softmax 확률."""
+
+    def __init__(self, model: nn.Module, spec: PreprocessSpec):
+        super().__init__()
+        self.model = model
+        self.div = spec.div
+        mean = torch.tensor(spec.mean or [0.0, 0.0, 0.0]).view(1, -1, 1, 1)
+        std = torch.tensor(spec.std or [1.0, 1.0, 1.0]).view(1, -1, 1, 1)
+        self.register_buffer("mean", mean)
+        self.register_buffer("std", std)
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        x = x.permute(0, 3, 1, 2).float() / self.div
+        x = (x - self.mean) / self.std
+        return torch.softmax(self.model(x), dim=1)
+
+
+def _export_module(learner, spec: PreprocessSpec, quantize: bool) -> nn.Module:
+    model = copy.deepcopy(learner.model).cpu().eval()
+    if quantize:
+        # 동적 양자화는 Linear/LSTM 계열에만 적용됨 (Conv는 float 유지)
+        model = torch.ao.quantization.quantize_dynamic(model, {nn.Linear}, dtype=torch.qint8)
+    return _ExportWrapper(model, spec).eval()
+
+
+def _example_input(spec: PreprocessSpec, n: int = 2) -> torch.Tensor:
+    w, h = spec.size or (224, 224)
+    return torch.zeros((n, h, w, 3), dtype=torch.uint8)
+
+
+def set_threads(threads: int | None) -> None:
+    """torch intra-op 스레드 수 설정 (None/0이면 기본값 유지)."""
+    if threads:
+        torch.set_num_threads(int(threads))
+
+
+# ======================
+# 엔진
+# ======================
+class _EngineBase:
+    name = ""
+    labels: list[str]
+    spec: PreprocessSpec
+
+    def predict_batch(self, images: list[Image.Image]) -> np.ndarray:
+        raise NotImplementedError
+
+    def predict(self, pil: Image.Image):
+        probs = self.predict_batch([pil])[0]
+        idx = int(probs.argmax())
+        return self.labels[idx], idx, probs
+
+
+class FastaiEngine(_EngineBase):
+    """기존 learner.predict / get_preds 경로."""
+    name = "fastai"
+
+    def __init__(self, learner):
+        self.learner = learner
+        self.labels = [str(x) for x in learner.dls.vocab]
+        # 입력은 비율을 유지한 축소까지만 하고 crop/resize는 learner의 item_tfms가 그대로 수행
+        self.spec = preprocess_spec(learner, exact=False)
+
+    def predict(self, pil: Image.Image):
+        from fastai.vision.all import PILImage
+        with self.learner.no_bar():
+            return self.learner.predict(PILImage.create(pil))
+
+    def predict_batch(self, images: list[Image.Image]) -> np.ndarray:
+        from batch_infer import predict_batch
+        return predict_batch(self.learner, images, batch_size=max(1, len(images)))
+
+
+class TorchScriptEngine(_EngineBase):
+    name = "torchscript"
+
+    def __init__(self, module: torch.jit.ScriptModule, labels: list[str], spec: PreprocessSpec):
+        self.module = module
+        self.labels = labels
+        self.spec = spec
+
+    @classmethod
+    def from_learner(cls, learner, quantize: bool = False) -> "TorchScriptEngine":
+        spec = preprocess_spec(learner)
+        with torch.inference_mode():
+            traced = torch.jit.trace(_export_module(learner, spec, quantize), _example_input(spec))
+        traced = torch.jit.freeze(traced)
+        return cls(traced, [str(x) for x in learner.dls.vocab], spec)
+
+    def save(self, path: str) -> None:
+        extra = {"labels.json": json.dumps(self.labels), "spec.json": self.spec.to_json()}
+        torch.jit.save(self.module, path, _extra_files=extra)
+
+    @classmethod
+    def load(cls, path: str) -> "TorchScriptEngine":
+        extra = {"labels.json": "", "spec.json": ""}
+        module = torch.jit.load(path, map_location="cpu", _extra_files=extra)
+        return cls(module, json.loads(extra["labels.json"]), PreprocessSpec.from_json(extra["spec.json"]))
+
+    def predict_batch(self, images: list[Image.Image]) -> np.ndarray:
+        x = torch.from_numpy(to_batch_array(images, self.spec))
+        with torch.inference_mode():
+            return self.module(x).numpy()
+
+
+def _require_onnx() -> None:
+    """onnx 백엔드의 선택 의존성 확인 (requirements.txt에는 주석으로만 들어 있음)."""
+    missing = [m for m in ("onnx", "onnxruntime") if importlib.util.find_spec(m) is None]
+    if missing:
+        raise ImportError(f"onnx backend requires {', '.join(missing)} (pip install onnx onnxruntime)")
+
+
+class OnnxEngine(_EngineBase):
+    name = "onnx"
+
+    def __init__(self, path: str, labels: list[str], spec: PreprocessSpec, threads: int | None = None):
+        import onnxruntime as ort
+        opts = ort.SessionOptions()
+        if threads:
+            opts.intra_op_num_threads = int(threads)
+        self.session = ort.InferenceSession(path, opts, providers=["CPUExecutionProvider"])
+        self.input_name = self.session.get_inputs()[0].name
+        self.path = path
+        self.labels = labels
+        self.spec = spec
+
+    @classmethod
+    def from_learner(cls, learner, path: str, quantize: bool = False, threads: int | None = None) -> "OnnxEngine":
+        _require_onnx()
+        spec = preprocess_spec(learner)
+        torch.onnx.export(
+            _export_module(learner, spec, quantize=False), (_example_input(spec),), path,
+            input_names=["image"], output_names=["probs"],
+            dynamic_axes={"image": {0: "batch"}, "probs": {0: "batch"}},
+            dynamo=False,
+        )
+        if quantize:
+            from onnxruntime.quantization import QuantType, quantize_dynamic
+            qpath = path.replace(".onnx", ".int8.onnx")
+            quantize_dynamic(path, qpath, weight_type=QuantType.QInt8)
+            path = qpath
+        return cls(path, [str(x) for x in learner.dls.vocab], spec, threads)
+
+    def predict_batch(self, images: list[Image.Image]) -> np.ndarray:
+        x = to_batch_array(images, self.spec)
+        return self.session.run(None, {self.input_name: x})[0]
+
+
+def build_engine(
+    learner,
+    backend: str = "fastai",
+    quantize: bool = False,
+    threads: int | None = None,
+    export_dir: str = ".engine_cache",
+):
+    """설정값으로 추론 엔진 생성. 알 수 없는 backend는 ValueError, 선택 의존성이 없으면 ImportError."""
+    set_threads(threads)
+    if backend == "fastai":
+        return FastaiEngine(learner)
+    if backend == "torchscript":
+        return TorchScriptEngine.from_learner(learner, quantize=quantize)
+    if backend == "onnx":
+        os.makedirs(export_dir, exist_ok=True)
+        return OnnxEngine.from_learner(learner, os.path.join(export_dir, "model.onnx"), quantize, threads)
+    raise ValueError(f"unknown inference backend: {backend!r} (choose from {', '.join(BACKENDS)})")
+
+
+# ======================
+# 검증 / 성능 비교
+# ======================
+def check_equivalence(learner, engine, images: list[Image.Image]) -> dict[str, float]:
+    """learner.predict 대비 top-1 일치율과 최대 확률 차이."""
+    from fastai.vision.all import PILImage
+    agree, max_delta = 0, 0.0
+    for im in images:
+        with learner.no_bar():
+            _, ref_idx, ref_probs = learner.predict(PILImage.create(np.array(im)))
+        _, idx, probs = engine.predict(im)
+        agree += int(int(ref_idx) == int(idx))
+        max_delta = max(max_delta, float(np.abs(np.asarray(ref_probs) - np.asarray(probs)).max()))
+    n = len(images)
+    return {"n": float(n), "top1_agreement": agree / n if n else 1.0, "max_prob_delta": max_delta}
+
+
+def measure_latency(engine, images: list[Image.Image], batch_size: int = 32, warmup: int = 2) -> dict[str, float]:
+    """단건 predict 지연(ms, p50/p95)과 배치 처리량(images/sec)."""
+    for im in images[:warmup]:
+        engine.predict(im)
+    lat = []
+    for im in images:
+        t = time.perf_counter()
+        engine.predict(im)
+        lat.append((time.perf_counter() - t) * 1000)
+    t = time.perf_counter()
+    for i in range(0, len(images), batch_size):
+        engine.predict_batch(images[i:i + batch_size])
+    batch_s = time.perf_counter() - t
+    return {
+        "single_ms_p50": float(np.percentile(lat, 50)),
+        "single_ms_p95": float(np.percentile(lat, 95)),
+        "batch_images_per_sec": len(images) / batch_s if batch_s > 0 else 0.0,
+    }
@@ -0,0 +1,187 @@
+# inference_scheduler.py
+# 여러 Streamlit 세션의 추론 요청을 한 큐에 모아 마이크로배치로 처리합니다.
+# - 전용 워커 스레드가 큐에서 최대 max_batch_size개, 최대 max_wait_ms까지 모아 한 번에 forward
+# - 각 요청은 Future로 자기 결과만 돌려받음
+# - 큐가 가득 차면 QueueFullError (backpressure), close() 뒤에는 SchedulerClosedError
+# - 일괄/동영상 분류는 별도 저우선순위 레인(bulk)으로 호출자가 정한 청크를 그대로 실행.
+#   워커는 대기 중인 단건 요청이 없을 때만 bulk 청크를 꺼내므로 긴 작업 중에도 단건 요청이 밀리지 않음
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Callable, Sequence
+
+import numpy as np
+from PIL import Image
+
+
+class QueueFullError(RuntimeError):
+    """스케줄러 큐가 가득 차 요청을 받을 수 없음."""
+
+
+class SchedulerClosedError(QueueFullError):
+    """close()된 스케줄러에 요청함 (QueueFullError처럼 잠시 뒤 다시 시도하면 됨)."""
+
+
+class MicroBatchScheduler:
+    def __init__(
+        self,
+        predict_batch: Callable[[list[Any]], Sequence[Any]],
+        max_batch_size: int = 16,
+        max_wait_ms: float = 5.0,
+        max_queue: int = 64,
+        name: str = "inference-scheduler",
+        max_bulk: int = 2,
+    ):
+        self.predict_batch = predict_batch
+        self.max_batch_size = max(1, int(max_batch_size))
+        self.max_wait = max(0.0, float(max_wait_ms)) / 1000
+        self.max_queue = max(1, int(max_queue))
+        self.max_bulk = max(1, int(max_bulk))
+        self._queue: deque[tuple[Any, Future]] = deque()
+        self._bulk: deque[tuple[list[Any], Future]] = deque()
+        self._cv = threading.Condition()
+        self._closed = False
+        self.batches = 0
+        self.items = 0
+        self.bulk_batches = 0
+        self.bulk_items = 0
+        self.rejected = 0
+        self._worker = threading.Thread(target=self._run, name=name, daemon=True)
+        self._worker.start()
+
+    def _wait_for(self, pred: Callable[[], bool], timeout: float | None) -> bool:
+        # self._cv를 잡은 상태에서 호출
+        if timeout is None:
+            self._cv.wait_for(pred)
+            return True
+        return self._cv.wait_for(pred, timeout)
+
+    def submit(self, item: Any, block: bool = False, timeout: float | None = None) -> Future:
+        """요청을 큐에 넣고 Future 반환. block=False면 큐가 가득 찼을 때 바로 QueueFullError."""
+        fut: Future = Future()
+        with self._cv:
+            has_room = lambda: self._closed or len(self._queue) < self.max_queue  # noqa: E731
+            if not has_room() and not (block and self._wait_for(has_room, timeout)):
+                self.rejected += 1
+                raise QueueFullError(f"inference queue is full ({self.max_queue})")
+            self._check_open()
+            self._queue.append((item, fut))
+            self._cv.notify_all()
+        return fut
+
+    def submit_bulk(self, items: list[Any], timeout: float | None = None) -> Future:
+        """청크 하나를 저우선순위로 한 번의 predict_batch로 실행. bulk 대기열이 차 있으면 자리가 날 때까지 대기."""
+        fut: Future = Future()
+        with self._cv:
+            if not self._wait_for(lambda: self._closed or len(self._bulk) < self.max_bulk, timeout):
+                raise QueueFullError(f"bulk queue is full ({self.max_bulk})")
+            self._check_open()
+            self._bulk.append((list(items), fut))
+            self._cv.notify_all()
+        return fut
+
+    def _check_open(self) -> None:
+        # self._cv를 잡은 상태에서 호출. 닫힌 뒤 넣은 요청은 워커가 처리하지 않으므로 기다리지 않고 바로 거부
+        if self._closed:
+            self.rejected += 1
+            raise SchedulerClosedError("inference scheduler is closed")
+
+    def predict(self, item: Any, timeout: float | None = None) -> Any:
+        return self.submit(item).result(timeout)
+
+    def _next(self) -> tuple[str, list] | None:
+        """다음 작업: ("single", [(item, fut), ...]) 또는 ("bulk", [(items, fut)]). 종료면 None."""
+        with self._cv:
+            self._cv.wait_for(lambda: self._queue or self._bulk or self._closed)
+            if self._queue:
+                deadline = time.perf_counter() + self.max_wait
+                while len(self._queue) < self.max_batch_size and not self._closed:
+                    remaining = deadline - time.perf_counter()
+                    if remaining <= 0 or not self._cv.wait(remaining):
+                        break
+                batch = [self._queue.popleft() for _ in range(min(self.max_batch_size, len(self._queue)))]
+                self._cv.notify_all()   # submit(block=True) 대기자 깨우기
+                return "single", batch
+            if self._bulk:
+                job = self._bulk.popleft()
+                self._cv.notify_all()
+                return "bulk", [job]
+            return None
+
+    def _run(self) -> None:
+        while True:
+            job = self._next()
+            if job is None:
+                return
+            kind, batch = job
+            batch = [(x, f) for x, f in batch if f.set_running_or_notify_cancel()]
+            if not batch:
+                continue
+            try:
+                if kind == "bulk":
+                    (items, f), = batch
+                    f.set_result(self.predict_batch(items))
+                else:
+                    outputs = self.predict_batch([x for x, _ in batch])
+            except BaseException as e:
+                for _, f in batch:
+                    f.set_exception(e)
+                continue
+            with self._cv:
+                if kind == "bulk":
+                    self.bulk_batches += 1
+                    self.bulk_items += len(items)
+                    continue
+                self.batches += 1
+                self.items += len(batch)
+            for (_, f), out in zip(batch, outputs):
+                f.set_result(out)
+
+    def close(self, timeout: float | None = None) -> None:
+        """대기 중인 요청을 모두 처리한 뒤 워커 종료."""
+        with self._cv:
+            self._closed = True
+            self._cv.notify_all()
+        self._worker.join(timeout)
+
+    def stats(self) -> dict[str, float]:
+        with self._cv:
+            return {
+                "queue": len(self._queue),
+                "batches": self.batches,
+                "items": self.items,
+                "avg_batch": self.items / self.batches if self.batches else 0.0,
+                "rejected": self.rejected,
+                "bulk_queue": len(self._bulk),
+                "bulk_batches": self.bulk_batches,
+                "bulk_items": self.bulk_items,
+            }
+
+
+class BatchedEngine:
+    """inference_engine의 엔진을 감싸 모든 추론을 스케줄러 워커 스레드에서 실행하는 엔진."""
+
+    def __init__(self, engine, max_batch_size: int = 16, max_wait_ms: float = 5.0, max_queue: int = 64):
+        self.engine = engine
+        self.name = engine.name
+        self.labels = engine.labels
+        self.spec = engine.spec
+        self.scheduler = MicroBatchScheduler(
+            lambda images: list(engine.predict_batch(images)),
+            max_batch_size=max_batch_size, max_wait_ms=max_wait_ms, max_queue=max_queue,
+            name=f"inference-scheduler-{engine.name}",
+        )
+
+    def predict(self, pil: Image.Image):
+        """큐가 가득 차면 QueueFullError."""
+        probs = np.asarray(self.scheduler.predict(pil))
+        idx = int(probs.argmax())
+        return self.labels[idx], idx, probs
+
+    def predict_batch(self, images: list[Image.Image]) -> np.ndarray:
+        """일괄/동영상 분류: 호출자의 청크를 bulk 레인에서 그대로 한 번에 실행 (단건 큐를 채우지 않음)."""
+        return np.asarray(self.scheduler.submit_bulk(images).result())
+
+    def close(self, timeout: float | None = None) -> None:
+        self.scheduler.close(timeout)
@@ -0,0 +1,154 @@
+# metrics.py
+# 요청 단위 단계별 지연(ms)과 최대 메모리 기록.
+# - RequestMetrics: with m.stage("decode"): ... 로 단계 시간을 잼
+# - MetricsSink   : 최근 요청을 메모리에 보관하고 JSONL 로그 / Prometheus 텍스트 파일로 내보냄
+# 메모리는 /proc/self/status의 VmHWM(최대 RSS)을 요청 시작 시 초기화해 측정합니다 (Linux).
+# 다른 세션과 같은 프로세스를 쓰므로 동시 요청이 있으면 값이 섞일 수 있습니다.
+import contextlib
+import json
+import os
+import threading
+import time
+import uuid
+from collections import deque
+from pathlib import Path
+
+_STATUS = Path("/proc/self/status")
+_CLEAR_REFS = Path("/proc/self/clear_refs")
+
+# Prometheus 히스토그램 경계(초)
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def vm_kb(key: str) -> int:
+    """/proc/self/status 값(kB). 없으면 0."""
+    try:
+        for line in _STATUS.read_text().splitlines():
+            if line.startswith(key + ":"):
+                return int(line.split()[1])
+    except OSError:
+        pass
+    return 0
+
+
+def reset_peak_rss() -> bool:
+    """VmHWM을 현재 RSS로 초기화. 지원하지 않는 환경이면 False."""
+    try:
+        _CLEAR_REFS.write_text("5")
+        return True
+    except OSError:
+        return False
+
+
+class RequestMetrics:
+    def __init__(self, kind: str = "predict", request_id: str | None = None, track_memory: bool = True):
+        self.kind = kind
+        self.request_id = request_id or uuid.uuid4().hex[:12]
+        self.stages: dict[str, float] = {}
+        self.t0 = time.perf_counter()
+        self.ts = time.time()
+        self._mem = track_memory and reset_peak_rss()
+        self._rss0 = vm_kb("VmRSS") if self._mem else 0
+
+    @contextlib.contextmanager
+    def stage(self, name: str):
+        t = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, (time.perf_counter() - t) * 1000)
+
+    def add(self, name: str, ms: float) -> None:
+        self.stages[name] = self.stages.get(name, 0.0) + ms
+
+    def add_all(self, timings: dict[str, float], prefix: str = "") -> None:
+        for k, v in timings.items():
+            self.add(prefix + k, v)
+
+    def finish(self) -> dict:
+        rec = {
+            "ts": self.ts,
+            "request_id": self.request_id,
+            "kind": self.kind,
+            "total_ms": (time.perf_counter() - self.t0) * 1000,
+            "stages": {k: round(v, 3) for k, v in self.stages.items()},
+        }
+        if self._mem:
+            rec["peak_rss_mb"] = vm_kb("VmHWM") / 1024
+            rec["peak_rss_delta_mb"] = max(0, vm_kb("VmHWM") - self._rss0) / 1024
+        return rec
+
+
+class MetricsSink:
+    """최근 요청 기록 + 선택적 JSONL 로그 / Prometheus 텍스트 파일."""
+
+    def __init__(self, jsonl_path: str | None = None, prom_path: str | None = None,
+                 keep: int = 200, prefix: str = "classifier"):
+        self.jsonl_path = jsonl_path
+        self.prom_path = prom_path
+        self.prefix = prefix
+        self.recent: deque[dict] = deque(maxlen=keep)
+        self._hist: dict[str, list[int]] = {}
+        self._sum: dict[str, float] = {}
+        self._count: dict[str, int] = {}
+        self._requests = 0
+        self._last_peak_mb = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, rec: dict) -> None:
+        with self._lock:
+            self.recent.append(rec)
+            self._requests += 1
+            self._last_peak_mb = rec.get("peak_rss_mb", self._last_peak_mb)
+            for name, ms in [*rec["stages"].items(), ("total", rec["total_ms"])]:
+                s = ms / 1000
+                h = self._hist.setdefault(name, [0] * len(BUCKETS))
+                for i, b in enumerate(BUCKETS):
+                    if s <= b:
+                        h[i] += 1
+                self._sum[name] = self._sum.get(name, 0.0) + s
+                self._count[name] = self._count.get(name, 0) + 1
+            if self.jsonl_path:
+                with open(self.jsonl_path, "a", encoding="utf-8") as fh:
+                    fh.write(json.dumps(rec, ensure_ascii=False) + "\n")
+            if self.prom_path:
+                self._write_prom()
+
+    def _write_prom(self) -> None:
+        p = self.prefix
+        lines = [
+            f"# HELP {p}_stage_duration_seconds Per-stage request latency.",
+            f"# TYPE {p}_stage_duration_seconds histogram",
+        ]
+        for name in sorted(self._hist):
+            for b, c in zip(BUCKETS, self._hist[name]):
+                lines.append(f'{p}_stage_duration_seconds_bucket{{stage="{name}",le="{b}"}} {c}')
+            lines.append(f'{p}_stage_duration_seconds_bucket{{stage="{name}",le="+Inf"}} {self._count[name]}')
+            lines.append(f'{p}_stage_duration_seconds_sum{{stage="{name}"}} {self._sum[name]:.6f}')
+            lines.append(f'{p}_stage_duration_seconds_count{{stage="{name}"}} {self._count[name]}')
+        lines += [
+            f"# HELP {p}_requests_total Instrumented requests.",
+            f"# TYPE {p}_requests_total counter",
+            f"{p}_requests_total {self._requests}",
+            f"# HELP {p}_peak_rss_bytes Peak RSS observed during the last request.",
+            f"# TYPE {p}_peak_rss_bytes gauge",
+            f"{p}_peak_rss_bytes {int(self._last_peak_mb * 1024 * 1024)}",
+        ]
+        tmp = f"{self.prom_path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            fh.write("\n".join(lines) + "\n")
+        os.replace(tmp, self.prom_path)
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """최근 요청 기준 단계별 p50/p95(ms)."""
+        with self._lock:
+            recs = list(self.recent)
+        per: dict[str, list[float]] = {}
+        for r in recs:
+            for k, v in [*r["stages"].items(), ("total", r["total_ms"])]:
+                per.setdefault(k, []).append(v)
+        out = {}
+        for k, vs in per.items():
+            vs.sort()
+            out[k] = {"n": len(vs), "p50": vs[len(vs) // 2], "p95": vs[min(len(vs) - 1, int(len(vs) * 0.95))]}
+        return out
@@ -0,0 +1,248 @@
+# model_artifacts.py
+# 모델 파일(model.pkl) 다운로드/검증/캐시와 콜드 스타트 시간 측정.
+# - 임시 파일로 받은 뒤 SHA-256 확인 후 os.replace로 원자적 교체 (부분/손상 파일을 unpickle하지 않음)
+# - <cache_dir>/<버전>/model.pkl 형태의 로컬 버전별 캐시
+# - fastai/torch import와 load_learner를 백그라운드 스레드에서 실행 가능
+#
+# source 형식:
+#   gdrive:<file_id>         Google Drive (gdown, 필요할 때만 import)
+#   https://... / http://...  일반 URL
+#   file:///abs/path, 경로    로컬 파일 (테스트용 대체 소스)
+#
+# 캐시 버전: sha256/version을 주면 그 값, 없으면 로컬 소스는 경로+크기+수정시각(파일을 바꾸면 새로 복사),
+# 원격 소스는 URL만으로 정해집니다. 원격 소스에 sha256/version이 없으면 한 번 받은 캐시를 다시 받지 않으므로
+# 모델을 바꿀 때는 MODEL_SHA256 또는 MODEL_VERSION을 함께 바꾸세요.
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+import urllib.request
+from pathlib import Path
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+
+def file_sha256(path: str, chunk_size: int = 1 << 20) -> str:
+    """파일 내용을 청크 단위로 읽어 SHA-256 해시를 계산."""
+    h = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class ModelIntegrityError(RuntimeError):
+    """받은 모델 파일의 SHA-256이 설정값과 다름."""
+
+
+class ModelArtifactManager:
+    def __init__(
+        self,
+        source: str,
+        cache_dir: str | os.PathLike = ".model_cache",
+        sha256: str | None = None,
+        version: str | None = None,
+        filename: str = "model.pkl",
+    ):
+        self.source = source
+        self.sha256 = sha256.lower() if sha256 else None
+        self.version = version or (self.sha256[:12] if self.sha256 else _slug(self._source_key()))
+        self.dir = Path(cache_dir) / self.version
+        self.path = self.dir / filename
+        self._meta_path = self.dir / (filename + ".json")
+
+    def _local_path(self) -> str | None:
+        src = self.source
+        if src.startswith(("gdrive:", "http://", "https://")):
+            return None
+        return src[len("file://"):] if src.startswith("file://") else src
+
+    def _source_key(self) -> str:
+        """버전이 없을 때 캐시 위치를 정하는 키. 로컬 파일은 크기/수정시각을 포함해 교체를 감지."""
+        path = self._local_path()
+        if path is not None:
+            try:
+                st = os.stat(path)
+            except OSError:
+                return self.source
+            return f"{self.source}|{st.st_size}|{st.st_mtime_ns}"
+        return self.source
+
+    # ---------- 검증 ----------
+    def _read_meta(self) -> dict:
+        try:
+            return json.loads(self._meta_path.read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def _write_meta(self, digest: str) -> None:
+        st = self.path.stat()
+        meta = {"sha256": digest, "size": st.st_size, "mtime_ns": st.st_mtime_ns, "source": self.source}
+        tmp = self._meta_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(meta))
+        os.replace(tmp, self._meta_path)
+
+    def cached_sha256(self) -> str | None:
+        """캐시 파일의 SHA-256. 크기/수정시각이 메타데이터와 같으면 다시 해시하지 않음."""
+        if not self.path.is_file():
+            return None
+        st = self.path.stat()
+        meta = self._read_meta()
+        if meta.get("size") == st.st_size and meta.get("mtime_ns") == st.st_mtime_ns and meta.get("sha256"):
+            return meta["sha256"]
+        digest = file_sha256(str(self.path))
+        self._write_meta(digest)
+        return digest
+
+    def is_valid(self) -> bool:
+        digest = self.cached_sha256()
+        return digest is not None and (self.sha256 is None or digest == self.sha256)
+
+    def fingerprint(self) -> str:
+        """예측 캐시 키에 쓰는 모델 지문."""
+        return (self.cached_sha256() or "missing")[:16]
+
+    # ---------- 다운로드 ----------
+    def _download_to(self, dst: str) -> None:
+        src = self.source
+        if src.startswith("gdrive:"):
+            import gdown
+            out = gdown.download(f"https://drive.google.com/uc?id={src[len('gdrive:'):]}", dst, quiet=True)
+            if out is None:
+                raise RuntimeError(f"gdown download failed: {src}")
+        elif src.startswith(("http://", "https://")):
+            with urllib.request.urlopen(src) as r, open(dst, "wb") as fh:
+                shutil.copyfileobj(r, fh, 1 << 20)
+        else:
+            shutil.copyfile(self._local_path(), dst)
+
+    def fetch(self) -> Path:
+        """검증된 로컬 모델 경로 반환. 없거나 해시가 다르면 다시 받음.
+
+        원격 소스에 sha256/version이 없으면 캐시가 있는 한 다시 받지 않습니다 (모듈 설명 참고).
+        """
+        if self.is_valid():
+            return self.path
+        self.dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.dir, prefix=".download-", suffix=".part")
+        os.close(fd)
+        try:
+            self._download_to(tmp)
+            digest = file_sha256(tmp)
+            if self.sha256 and digest != self.sha256:
+                raise ModelIntegrityError(f"sha256 mismatch for {self.source}: expected {self.sha256}, got {digest}")
+            os.chmod(tmp, 0o644)
+            os.replace(tmp, self.path)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+        self._write_meta(digest)
+        return self.path
+
+
+def _slug(s: str) -> str:
+    return "src-" + hashlib.sha256(s.encode()).hexdigest()[:12]
+
+
+# ======================
+# 시작 시간 측정
+# ======================
+class StartupTimer:
+    """단계별(imports, download, unpickle, first_predict ...) 소요 시간(ms) 기록."""
+
+    def __init__(self):
+        self.t0 = time.perf_counter()
+        self.phases: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def add(self, name: str, ms: float) -> None:
+        with self._lock:
+            self.phases[name] = self.phases.get(name, 0.0) + ms
+
+    @contextlib.contextmanager
+    def phase(self, name: str, once: bool = False):
+        """once=True면 이미 기록된 단계는 다시 재지 않음 (예: first_predict)."""
+        if once and name in self.phases:
+            yield
+            return
+        t = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, (time.perf_counter() - t) * 1000)
+            logger.info("startup phase %s: %.1f ms", name, self.phases[name])
+            if once:
+                self.log()
+
+    def as_dict(self) -> dict[str, float]:
+        with self._lock:
+            return {**self.phases, "since_start": (time.perf_counter() - self.t0) * 1000}
+
+    def log(self) -> None:
+        logger.info("startup timing %s", json.dumps({k: round(v, 1) for k, v in self.as_dict().items()}))
+
+
+# ======================
+# 백그라운드 로딩
+# ======================
+def load_fastai_learner(path: str | os.PathLike, timer: StartupTimer):
+    with timer.phase("imports"):
+        from fastai.learner import load_learner
+        import fastai.vision.all  # noqa: F401  (pickle 안의 vision 변환 클래스)
+    with timer.phase("unpickle"):
+        return load_learner(path, cpu=True)
+
+
+class ModelLoader:
+    """fetch + load를 한 번만 실행. background=True면 별도 스레드에서 미리 시작."""
+
+    def __init__(
+        self,
+        manager: ModelArtifactManager,
+        timer: StartupTimer,
+        load_fn: Callable[[str | os.PathLike, StartupTimer], Any] = load_fastai_learner,
+        background: bool = True,
+    ):
+        self.manager = manager
+        self.timer = timer
+        self.load_fn = load_fn
+        self._done = threading.Event()
+        self._result: Any = None
+        self._error: BaseException | None = None
+        self._thread: threading.Thread | None = None
+        self._sync_lock = threading.Lock()
+        if background:
+            self._thread = threading.Thread(target=self._run, name="model-loader", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        try:
+            with self.timer.phase("download"):
+                path = self.manager.fetch()
+            self._result = self.load_fn(path, self.timer)
+        except BaseException as e:
+            self._error = e
+            logger.exception("model load failed")
+        finally:
+            self._done.set()
+
+    def ready(self) -> bool:
+        return self._done.is_set()
+
+    def result(self, timeout: float | None = None):
+        """로드된 모델 반환 (필요하면 대기). 실패했다면 같은 예외를 다시 발생."""
+        if self._thread is None:
+            with self._sync_lock:
+                if not self._done.is_set():
+                    self._run()
+        if not self._done.wait(timeout):
+            raise TimeoutError("model is still loading")
+        if self._error is not None:
+            raise self._error
+        return self._result
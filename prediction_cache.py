@@ -0,0 +1,101 @@
+# prediction_cache.py
+# 이미지 바이트 해시 + 모델 지문(fingerprint)으로 예측 결과를 캐시합니다.
+# Streamlit 재실행(rerun)마다 같은 이미지에 learner.predict를 다시 돌리지 않기 위함
+import hashlib
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Callable
+
+
+def image_key(b: bytes) -> str:
+    """이미지 원본 바이트의 SHA-256 해시."""
+    return hashlib.sha256(b).hexdigest()
+
+
+def _sizeof(value: Any) -> int:
+    """캐시 값(pred, pred_idx, probs)의 대략적인 메모리 크기(바이트)."""
+    total = 0
+    for v in value if isinstance(value, tuple) else (value,):
+        if hasattr(v, "nbytes"):                              # numpy
+            total += int(v.nbytes)
+        elif hasattr(v, "element_size") and hasattr(v, "nelement"):  # torch.Tensor
+            total += int(v.element_size() * v.nelement())
+        else:
+            total += sys.getsizeof(v)
+    return total
+
+
+class PredictionCache:
+    """스레드 안전한 LRU 예측 캐시.
+
+    - 키: (모델 지문, 이미지 해시)
+    - 값: learner.predict 결과 (pred, pred_idx, probs)
+    - max_entries / max_bytes 중 하나라도 넘으면 가장 오래 안 쓴 항목부터 제거
+    """
+
+    def __init__(self, max_entries: int = 256, max_bytes: int = 64 * 1024 * 1024):
+        self.max_entries = max(1, int(max_entries))
+        self.max_bytes = max(1, int(max_bytes))
+        self._data: OrderedDict[tuple[str, str], tuple[Any, int]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, fingerprint: str, key: str):
+        """있으면 값을 반환하고 최근 사용으로 표시. 없으면 None."""
+        k = (fingerprint, key)
+        with self._lock:
+            item = self._data.get(k)
+            if item is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(k)
+            self.hits += 1
+            return item[0]
+
+    def put(self, fingerprint: str, key: str, value: Any) -> None:
+        size = _sizeof(value)
+        k = (fingerprint, key)
+        with self._lock:
+            old = self._data.pop(k, None)
+            if old is not None:
+                self._bytes -= old[1]
+            if size > self.max_bytes:   # 단일 항목이 예산보다 크면 저장하지 않음
+                return
+            self._data[k] = (value, size)
+            self._bytes += size
+            while len(self._data) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, s) = self._data.popitem(last=False)
+                self._bytes -= s
+                self.evictions += 1
+
+    def get_or_compute(self, fingerprint: str, key: str, compute: Callable[[], Any]):
+        """캐시 조회 후 없으면 compute()를 호출해 저장."""
+        value = self.get(fingerprint, key)
+        if value is None:
+            value = compute()
+            self.put(fingerprint, key, value)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict[str, int | float]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._data),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": (self.hits / total) if total else 0.0,
+            }
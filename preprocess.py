@@ -0,0 +1,153 @@
+# preprocess.py
+# learner의 변환(Resize, RandomResizedCrop, IntToFloatTensor, Normalize)을 읽어 추론용 전처리를 재현합니다.
+# torch/fastai를 import하지 않으므로 앱 시작 시 가볍게 불러올 수 있습니다.
+import json
+import math
+from dataclasses import dataclass
+
+import numpy as np
+from PIL import Image
+
+_PAD_MODES = {"zeros": "constant", "border": "edge", "reflection": "reflect"}
+_RESIZE_METHODS = ("crop", "squish", "pad")
+_MARK = "preprocess_spec"   # resize_like_fastai 결과 이미지의 info에 남기는 표시 (값: spec JSON)
+
+
+class UnsupportedTransformError(ValueError):
+    """PIL로 재현할 수 없는 검증 변환이 learner에 있음 (fastai 백엔드로 대체해야 함)."""
+
+
+# ======================
+# 전처리 스펙 (learner의 변환에서 추출)
+# ======================
+@dataclass
+class PreprocessSpec:
+    size: tuple[int, int] | None = None      # (w, h), None이면 리사이즈 안 함
+    method: str = "crop"                      # crop | squish | pad | rrc (RandomResizedCrop)
+    val_size: tuple[int, int] | None = None  # rrc: 가운데 crop 전에 squish하는 크기 (w, h)
+    pad_mode: str = "reflection"
+    resample: int = Image.BILINEAR
+    div: float = 255.0
+    mean: list[float] | None = None
+    std: list[float] | None = None
+    # True: resize_like_fastai가 learner의 검증 변환을 그대로 재현 (내보내기 백엔드)
+    # False: size는 축소 디코딩 하한으로만 쓰고 crop/resize는 learner의 item_tfms에 맡김 (fastai 백엔드)
+    exact: bool = True
+
+    def to_json(self) -> str:
+        return json.dumps(self.__dict__)
+
+    @classmethod
+    def from_json(cls, s: str) -> "PreprocessSpec":
+        d = json.loads(s)
+        for k in ("size", "val_size"):
+            if d.get(k) is not None: d[k] = tuple(d[k])
+        return cls(**d)
+
+    @property
+    def min_decode_size(self) -> tuple[int, int] | None:
+        """축소 디코딩 하한 (w, h). rrc는 squish 크기가 모델 입력보다 큼."""
+        return self.val_size if self.method == "rrc" else self.size
+
+
+def _type_names(t) -> set[str]:
+    return {c.__name__ for c in type(t).__mro__}
+
+
+def preprocess_spec(learner, exact: bool = True) -> PreprocessSpec:
+    """learner.dls의 after_item / after_batch 변환을 타입으로 구분해 추론용 전처리를 읽어옴.
+
+    검증 동작을 아는 변환(Resize, RandomResizedCrop, IntToFloatTensor, Normalize, size 없는 affine)과
+    학습 전용 변환(split_idx == 0)만 허용합니다. 그 밖의 변환이 있으면 exact=True일 때
+    UnsupportedTransformError, exact=False일 때는 축소 디코딩도 하지 않도록 size=None을 돌려줍니다.
+    """
+    spec = PreprocessSpec(exact=exact)
+    unsupported = []
+    for t in learner.dls.after_item.fs:
+        names = _type_names(t)
+        if t.split_idx == 0 or "ToTensor" in names:
+            continue
+        if spec.size is None and "RandomResizedCrop" in names:
+            w, h = int(t.size[0]), int(t.size[1])
+            xtra = math.ceil(max(w, h) * t.val_xtra / 8) * 8
+            spec.size, spec.val_size, spec.method = (w, h), (w + xtra, h + xtra), "rrc"
+            spec.resample = int(t.mode)
+        elif spec.size is None and "Resize" in names and str(t.method) in _RESIZE_METHODS:
+            spec.size = (int(t.size[0]), int(t.size[1]))
+            spec.method = str(t.method)
+            spec.pad_mode = str(t.pad_mode)
+            spec.resample = int(t.mode)
+        else:
+            unsupported.append(type(t).__name__)
+    for t in learner.dls.after_batch.fs:
+        names = _type_names(t)
+        if t.split_idx == 0:
+            continue
+        if "IntToFloatTensor" in names:
+            spec.div = float(t.div)
+        elif "Normalize" in names:
+            spec.mean = [float(x) for x in t.mean.flatten()]
+            spec.std = [float(x) for x in t.std.flatten()]
+        elif "AffineCoordTfm" in names and t.size is None:
+            continue   # 검증에서는 항등 행렬 (flip/rotate/zoom/warp 모두 꺼짐)
+        else:
+            unsupported.append(type(t).__name__)
+    if unsupported:
+        if exact:
+            raise UnsupportedTransformError(f"unsupported transforms: {', '.join(unsupported)}")
+        spec.size = spec.val_size = None
+        spec.method = "crop"
+    return spec
+
+
+def resize_like_fastai(pil: Image.Image, spec: PreprocessSpec) -> Image.Image:
+    """fastai Resize / RandomResizedCrop의 검증(valid) 동작을 PIL로 재현. exact=False면 그대로 반환."""
+    if spec.size is None or not spec.exact:
+        return pil
+    out = _resize(pil, spec)
+    out.info[_MARK] = spec.to_json()
+    return out
+
+
+def _resize(pil: Image.Image, spec: PreprocessSpec) -> Image.Image:
+    tw, th = spec.size
+    w, h = pil.size
+    if spec.method == "rrc":
+        # 전체를 val_size로 squish한 뒤 가운데를 size만큼 crop
+        vw, vh = spec.val_size
+        left, top = (vw - tw) // 2, (vh - th) // 2
+        return pil.resize((vw, vh), spec.resample).crop((left, top, left + tw, top + th))
+    if spec.method == "squish":
+        return pil.resize((tw, th), spec.resample)
+    ratio_w, ratio_h = w / tw, h / th
+    if spec.method == "pad":
+        m = max(ratio_w, ratio_h)
+    else:
+        m = min(ratio_w, ratio_h)
+    cw, ch = int(m * tw), int(m * th)
+    left, top = int(0.5 * (w - cw)), int(0.5 * (h - ch))
+    if left >= 0 and top >= 0:
+        return pil.crop((left, top, left + cw, top + ch)).resize((tw, th), spec.resample)
+    # pad: 부족한 쪽을 pad_mode로 채운 뒤 리사이즈
+    arr = np.asarray(pil)
+    pl, pt = max(-left, 0), max(-top, 0)
+    pr, pb = max(cw - w - pl, 0), max(ch - h - pt, 0)
+    arr = np.pad(arr, ((pt, pb), (pl, pr), (0, 0)), mode=_PAD_MODES.get(spec.pad_mode, "reflect"))
+    return Image.fromarray(arr).resize((tw, th), spec.resample)
+
+
+def to_batch_array(images: list[Image.Image], spec: PreprocessSpec) -> np.ndarray:
+    """PIL 리스트 -> (N, H, W, 3) uint8 배열.
+
+    resize_like_fastai를 이미 거친 이미지(image_ingest 결과)는 리사이즈 없이 픽셀 버퍼를 배치 배열에 한 번만 복사합니다.
+    """
+    key = spec.to_json()
+    imgs = [im if im.info.get(_MARK) == key else resize_like_fastai(im, spec) for im in images]
+    w, h = imgs[0].size
+    if any(im.size != (w, h) for im in imgs):
+        return np.stack([np.asarray(im, dtype=np.uint8) for im in imgs])
+    out = np.empty((len(imgs), h, w, 3), dtype=np.uint8)
+    for i, im in enumerate(imgs):
+        if im.mode != "RGB": im = im.convert("RGB")
+        out[i] = np.frombuffer(im.tobytes(), dtype=np.uint8).reshape(h, w, 3)
+    return out
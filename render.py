@@ -0,0 +1,113 @@
+# render.py
+# 결과 패널 HTML 조각. Streamlit 없이도 호출할 수 있어 벤치마크에서 렌더링 단계를 잴 수 있습니다.
+# - *_card_html: 카드 하나 (st.markdown 한 번에 하나씩 출력하던 기존 방식)
+# - top_k / prob_panel_html / cards_html: 클래스가 많은 모델용. 상위 k개만 골라 한 블록으로 출력
+import html
+import re
+
+import numpy as np
+
+
+def yt_id_from_url(url: str) -> str | None:
+    if not url: return None
+    pats = [r"(?:v=|/)([0-9A-Za-z_-]{11})(?:\?|&|/|$)", r"youtu\.be/([0-9A-Za-z_-]{11})"]
+    for p in pats:
+        m = re.search(p, url)
+        if m: return m.group(1)
+    return None
+
+def yt_thumb(url: str) -> str | None:
+    vid = yt_id_from_url(url)
+    return f"https://img.youtube.com/vi/{vid}/hqdefault.jpg" if vid else None
+
+def prediction_box_html(pred: str) -> str:
+    return f"""
+            <div class="prediction-box">
+                <span style="font-size:1.0rem;color:#555;">예측 결과:</span>
+                <h2>{pred}</h2>
+                <div class="helper">오른쪽 패널에서 예측 라벨의 콘텐츠가 표시됩니다.</div>
+            </div>
+            """
+
+def prob_card_html(lbl: str, p: float, highlight: bool = False) -> str:
+    pct = p * 100
+    hi = "highlight" if highlight else ""
+    return f"""
+                <div class="prob-card">
+                  <div style="display:flex;justify-content:space-between;margin-bottom:6px;">
+                    <strong>{lbl}</strong><span>{pct:.2f}%</span>
+                  </div>
+                  <div class="prob-bar-bg">
+                    <div class="prob-bar-fg {hi}" style="width:{pct:.4f}%;"></div>
+                  </div>
+                </div>
+                """
+
+def sorted_probs(labels: list[str], probs) -> list[tuple[str, float]]:
+    return sorted(
+        [(labels[i], float(probs[i])) for i in range(len(labels))],
+        key=lambda x: x[1], reverse=True
+    )
+
+def top_k(probs, k: int | None) -> tuple[np.ndarray, float]:
+    """확률 상위 k개 인덱스(내림차순)와 나머지 확률 합.
+
+    전체를 정렬하지 않고 np.partition으로 k번째 값만 찾은 뒤 그보다 큰 항목과 같은 값의 항목(인덱스 순)을
+    골라 그 k개만 정렬합니다. 결과는 전체 안정 정렬의 앞 k개와 같습니다 (동점은 인덱스가 작은 쪽이 먼저).
+    k가 None/0이거나 클래스 수 이상이면 전체를 정렬합니다.
+    """
+    p = np.asarray(probs, dtype=np.float64).ravel()
+    if not k or k >= p.size:
+        return np.argsort(-p, kind="stable"), 0.0
+    kth = -np.partition(-p, k - 1)[k - 1]
+    above = np.flatnonzero(p > kth)
+    ties = np.flatnonzero(p == kth)[: k - above.size]
+    idx = np.concatenate([above, ties])
+    idx = idx[np.lexsort((idx, -p[idx]))]
+    return idx, max(0.0, float(p.sum() - p[idx].sum()))
+
+def _one_line(s: str) -> str:
+    # 여러 카드를 한 st.markdown으로 보낼 때 들여쓰기/빈 줄이 마크다운 코드 블록으로 해석되지 않도록
+    return " ".join(x.strip() for x in s.splitlines() if x.strip())
+
+def prob_panel_html(labels: list[str], probs, k: int | None = 10, highlight: str | None = None,
+                    others: bool = True) -> str:
+    """상위 k개 확률 막대 + '기타' 합계를 하나의 HTML 블록으로."""
+    p = np.asarray(probs, dtype=np.float64).ravel()
+    idx, rest = top_k(p, k)
+    rows = [_one_line(prob_card_html(html.escape(labels[i]), float(p[i]), labels[i] == highlight)) for i in idx]
+    if others and len(idx) < p.size:
+        rows.append(_one_line(prob_card_html(f"기타 {p.size - len(idx):,}개 라벨", rest)))
+    return '<div class="prob-list">' + "".join(rows) + "</div>"
+
+def cards_html(cards: list[str]) -> str:
+    """카드 여러 개를 info-grid 하나로 묶은 HTML 블록."""
+    return '<div class="info-grid">' + "".join(_one_line(c) for c in cards) + "</div>"
+
+def text_card_html(t: str) -> str:
+    return f"""
+                    <div class="card" style="grid-column:span 12;">
+                      <h4>텍스트</h4>
+                      <div>{t}</div>
+                    </div>
+                    """
+
+def video_card_html(v: str) -> str:
+    thumb = yt_thumb(v)
+    if thumb:
+        return f"""
+                        <div class="card" style="grid-column:span 6;">
+                          <h4>동영상</h4>
+                          <a href="{v}" target="_blank" class="thumb-wrap">
+                            <img src="{thumb}" class="thumb"/>
+                            <div class="play"></div>
+                          </a>
+                          <div class="helper">{v}</div>
+                        </div>
+                        """
+    return f"""
+                        <div class="card" style="grid-column:span 6;">
+                          <h4>동영상</h4>
+                          <a href="{v}" target="_blank">{v}</a>
+                        </div>
+                        """
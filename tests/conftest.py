@@ -0,0 +1,5 @@
+# 저장소 루트의 모듈(flat layout)을 테스트에서 import 할 수 있도록
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
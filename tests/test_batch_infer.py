@@ -0,0 +1,64 @@
+import zipfile
+from io import BytesIO
+
+import numpy as np
+from PIL import Image
+
+from batch_infer import classify_files, count_images
+
+
+class Upload(BytesIO):
+    """Streamlit UploadedFile 대역 (name / getvalue / seek / read)."""
+
+    def __init__(self, name: str, data: bytes):
+        super().__init__(data)
+        self.name = name
+
+
+def jpeg(color) -> bytes:
+    buf = BytesIO()
+    Image.new("RGB", (32, 24), color).save(buf, format="JPEG")
+    return buf.getvalue()
+
+
+def zip_of(members: dict[str, bytes]) -> bytes:
+    buf = BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        for name, data in members.items():
+            zf.writestr(name, data)
+    return buf.getvalue()
+
+
+class FakeEngine:
+    labels = ["a", "b"]
+    spec = None
+
+    def __init__(self):
+        self.sizes: list[int] = []
+
+    def predict_batch(self, images):
+        self.sizes.append(len(images))
+        return np.tile(np.array([[0.25, 0.75]], dtype=np.float32), (len(images), 1))
+
+
+def uploads():
+    return [
+        Upload("one.jpg", jpeg("red")),
+        Upload("broken.zip", b"not a zip archive"),
+        Upload("imgs.zip", zip_of({"x.jpg": jpeg("blue"), "y.png": b"garbage", "notes.txt": b"skip"})),
+    ]
+
+
+def test_count_images_counts_bad_zip_as_one_row():
+    assert count_images(uploads()) == 1 + 1 + 2
+
+
+def test_bad_zip_and_bad_member_become_error_rows_in_order():
+    engine = FakeEngine()
+    df, stats = classify_files(engine, uploads(), batch_size=2)
+    assert list(df["file"]) == ["one.jpg", "broken.zip", "imgs.zip/x.jpg", "imgs.zip/y.png"]
+    assert list(df["prediction"].isna()) == [False, True, False, True]
+    assert df.loc[1, "error"].startswith("invalid zip")
+    assert df.loc[3, "error"]
+    assert stats["images"] == 2 and stats["failed"] == 2
+    assert engine.sizes == [1, 1]
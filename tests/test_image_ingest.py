@@ -0,0 +1,25 @@
+from io import BytesIO
+
+from PIL import Image
+
+from image_ingest import ingest
+from preprocess import PreprocessSpec
+
+
+def jpeg(w: int, h: int) -> bytes:
+    buf = BytesIO()
+    Image.new("RGB", (w, h), (200, 40, 40)).save(buf, format="JPEG")
+    return buf.getvalue()
+
+
+def test_exact_spec_gives_model_size():
+    ing = ingest(jpeg(1200, 400), PreprocessSpec(size=(64, 64)), preview_max=None)
+    assert ing.image.size == (64, 64)
+
+
+def test_inexact_spec_only_reduces_keeping_aspect():
+    ing = ingest(jpeg(1200, 400), PreprocessSpec(size=(64, 64), exact=False), preview_max=None)
+    w, h = ing.image.size
+    assert w >= 64 and h >= 64
+    assert w < 1200 and h < 400
+    assert abs(w / h - 3.0) < 0.05
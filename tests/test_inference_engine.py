@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+from PIL import Image
+
+pytest.importorskip("fastai")
+import torch  # noqa: E402
+from fastai.vision.all import (  # noqa: E402
+    ImageDataLoaders, Learner, PILImage, RandomCrop, RandomResizedCrop, Resize, ResizeMethod, nn,
+)
+
+from inference_engine import FastaiEngine, TorchScriptEngine  # noqa: E402
+from preprocess import UnsupportedTransformError, preprocess_spec  # noqa: E402
+
+
+def make_learner(root, item_tfms, size: int = 64):
+    """학습하지 않은 작은 learner. 위치에 민감하도록 pooling 없이 Flatten -> Linear."""
+    rng = np.random.default_rng(0)
+    for name in ("a", "b"):
+        (root / name).mkdir(parents=True, exist_ok=True)
+        for i in range(4):
+            Image.fromarray(rng.integers(0, 255, (80, 96, 3), dtype=np.uint8)).save(root / name / f"{i}.png")
+    dls = ImageDataLoaders.from_folder(root, valid_pct=0.5, item_tfms=item_tfms, bs=2, num_workers=0, seed=0)
+    torch.manual_seed(0)
+    model = nn.Sequential(nn.Conv2d(3, 4, 3, 2, 1), nn.Flatten(), nn.Linear(4 * (size // 2) ** 2, 2))
+    return Learner(dls, model)
+
+
+def wide_image() -> Image.Image:
+    """가로로 긴 300x100 그라데이션 + 노이즈 (crop 위치가 틀리면 결과가 달라짐)."""
+    rng = np.random.default_rng(1)
+    x = np.linspace(0, 255, 300)[None, :, None] * np.ones((100, 1, 3))
+    return Image.fromarray(np.clip(x + rng.normal(0, 20, x.shape), 0, 255).astype(np.uint8))
+
+
+@pytest.mark.parametrize("tfm", [
+    RandomResizedCrop(64),
+    Resize(64),
+    Resize(64, method=ResizeMethod.Squish),
+    Resize(64, method=ResizeMethod.Pad),
+])
+def test_torchscript_matches_learner_predict(tmp_path, tfm):
+    learner = make_learner(tmp_path, tfm)
+    img = wide_image()
+    with learner.no_bar():
+        _, _, expected = learner.predict(PILImage.create(np.asarray(img)))
+    _, _, probs = TorchScriptEngine.from_learner(learner).predict(img)
+    np.testing.assert_allclose(np.asarray(probs), expected.numpy(), atol=2e-3)
+
+
+def test_unsupported_transform_falls_back(tmp_path):
+    learner = make_learner(tmp_path, RandomCrop(64))
+    with pytest.raises(UnsupportedTransformError):
+        preprocess_spec(learner)
+    with pytest.raises(ValueError):
+        TorchScriptEngine.from_learner(learner)
+    engine = FastaiEngine(learner)
+    assert engine.spec.size is None   # 축소 디코딩도 하지 않음
+    with learner.no_bar():
+        _, _, expected = learner.predict(PILImage.create(np.asarray(wide_image())))
+    np.testing.assert_allclose(np.asarray(engine.predict(wide_image())[2]), expected.numpy())
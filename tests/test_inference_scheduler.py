@@ -0,0 +1,190 @@
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from inference_scheduler import BatchedEngine, MicroBatchScheduler, QueueFullError, SchedulerClosedError
+
+
+class Recorder:
+    """predict_batch 대역: 호출마다 배치 크기를 기록하고 item * 10을 돌려줌."""
+
+    def __init__(self, delay: float = 0.0, gate: threading.Event | None = None):
+        self.sizes: list[int] = []
+        self.delay = delay
+        self.gate = gate
+
+    def __call__(self, items):
+        if self.gate is not None:
+            self.gate.wait(5)
+        if self.delay:
+            time.sleep(self.delay)
+        self.sizes.append(len(items))
+        return [x * 10 for x in items]
+
+
+def test_groups_concurrent_requests_into_batches():
+    rec = Recorder()
+    sched = MicroBatchScheduler(rec, max_batch_size=8, max_wait_ms=200)
+    try:
+        futs = [sched.submit(i) for i in range(8)]
+        assert [f.result(2) for f in futs] == [i * 10 for i in range(8)]
+    finally:
+        sched.close(2)
+    assert rec.sizes == [8]
+    assert sched.stats()["avg_batch"] == 8
+
+
+def test_each_caller_gets_its_own_result():
+    sched = MicroBatchScheduler(Recorder(), max_batch_size=4, max_wait_ms=5)
+    out: dict[int, int] = {}
+
+    def call(i: int) -> None:
+        out[i] = sched.predict(i, timeout=2)
+
+    threads = [threading.Thread(target=call, args=(i,)) for i in range(20)]
+    for th in threads:
+        th.start()
+    for th in threads:
+        th.join()
+    sched.close(2)
+    assert out == {i: i * 10 for i in range(20)}
+
+
+def test_rejects_when_queue_is_full():
+    gate = threading.Event()
+    sched = MicroBatchScheduler(Recorder(gate=gate), max_batch_size=1, max_wait_ms=0, max_queue=2)
+    try:
+        first = sched.submit(0)
+        time.sleep(0.05)                 # 워커가 첫 요청을 꺼내 gate에서 대기
+        queued = [sched.submit(1), sched.submit(2)]
+        with pytest.raises(QueueFullError):
+            sched.submit(3)
+        assert sched.stats()["rejected"] == 1
+        gate.set()
+        assert [f.result(2) for f in [first, *queued]] == [0, 10, 20]
+    finally:
+        gate.set()
+        sched.close(2)
+
+
+def test_errors_are_delivered_to_every_caller():
+    def boom(items):
+        raise ValueError("bad batch")
+
+    sched = MicroBatchScheduler(boom, max_batch_size=4, max_wait_ms=50)
+    try:
+        futs = [sched.submit(i) for i in range(3)]
+        for f in futs:
+            with pytest.raises(ValueError):
+                f.result(2)
+    finally:
+        sched.close(2)
+
+
+def test_bulk_keeps_caller_chunk_size():
+    rec = Recorder()
+    sched = MicroBatchScheduler(rec, max_batch_size=4, max_wait_ms=1)
+    try:
+        assert sched.submit_bulk(list(range(7))).result(2) == [i * 10 for i in range(7)]
+        assert sched.submit_bulk(list(range(30))).result(2)[-1] == 290
+    finally:
+        sched.close(2)
+    assert rec.sizes == [7, 30]
+    assert sched.stats()["bulk_items"] == 37
+
+
+def test_interactive_requests_are_not_starved_by_bulk_jobs():
+    rec = Recorder(delay=0.02)
+    sched = MicroBatchScheduler(rec, max_batch_size=4, max_wait_ms=1, max_queue=2)
+    done = threading.Event()
+
+    def bulk_job() -> None:
+        for k in range(30):              # 30 청크 x 20 ms
+            sched.submit_bulk([k] * 8).result(5)
+        done.set()
+
+    th = threading.Thread(target=bulk_job)
+    th.start()
+    try:
+        time.sleep(0.05)
+        for i in range(10):
+            t = time.perf_counter()
+            assert sched.predict(i, timeout=2) == i * 10   # block=False: 큐가 차 있으면 QueueFullError
+            # 진행 중인 bulk 청크 하나와 자기 배치만 기다림
+            assert time.perf_counter() - t < 0.2
+        assert not done.is_set()
+    finally:
+        th.join(10)
+        sched.close(2)
+    assert sched.stats()["rejected"] == 0
+
+
+def test_batched_engine_routes_bulk_and_single_calls():
+    class FakeEngine:
+        name = "fake"
+        labels = ["a", "b", "c"]
+        spec = None
+
+        def __init__(self):
+            self.sizes: list[int] = []
+
+        def predict_batch(self, images):
+            self.sizes.append(len(images))
+            return np.tile(np.array([[0.1, 0.7, 0.2]], dtype=np.float32), (len(images), 1))
+
+    fake = FakeEngine()
+    eng = BatchedEngine(fake, max_batch_size=16, max_wait_ms=1)
+    try:
+        assert eng.predict_batch([object()] * 40).shape == (40, 3)
+        label, idx, probs = eng.predict(object())
+    finally:
+        eng.scheduler.close(2)
+    assert (label, idx) == ("b", 1)
+    assert probs.shape == (3,)
+    assert fake.sizes == [40, 1]
+
+
+def test_submit_after_close_raises_instead_of_hanging():
+    sched = MicroBatchScheduler(Recorder(), max_batch_size=4, max_wait_ms=1)
+    pending = sched.submit(1)
+    sched.close(2)
+    assert pending.result(2) == 10       # 닫기 전에 받은 요청은 처리
+    with pytest.raises(SchedulerClosedError):
+        sched.submit(2)
+    with pytest.raises(SchedulerClosedError):
+        sched.submit_bulk([1, 2])
+    with pytest.raises(QueueFullError):  # 앱은 QueueFullError로 함께 처리
+        sched.predict(3, timeout=2)
+
+
+def test_close_wakes_blocked_submitters():
+    gate = threading.Event()
+    sched = MicroBatchScheduler(Recorder(gate=gate), max_batch_size=1, max_wait_ms=0, max_queue=1, max_bulk=1)
+    errors: list[BaseException] = []
+
+    def blocked(fn) -> None:
+        try:
+            fn()
+        except BaseException as e:
+            errors.append(e)
+
+    try:
+        sched.submit(0)
+        time.sleep(0.05)                 # 워커가 첫 요청을 꺼내 gate에서 대기
+        sched.submit(1)
+        sched.submit_bulk([2])
+        threads = [threading.Thread(target=blocked, args=(lambda: sched.submit(3, block=True),)),
+                   threading.Thread(target=blocked, args=(lambda: sched.submit_bulk([4]),))]
+        for th in threads:
+            th.start()
+        time.sleep(0.05)
+        sched.close(timeout=0)           # 워커는 gate에서 대기 중이라 기다리지 않고 반환
+        for th in threads:
+            th.join(2)
+        assert not any(th.is_alive() for th in threads)
+        assert len(errors) == 2 and all(isinstance(e, SchedulerClosedError) for e in errors)
+    finally:
+        gate.set()
+        sched.close(2)
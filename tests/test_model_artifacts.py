@@ -0,0 +1,52 @@
+import hashlib
+import os
+
+import pytest
+
+from model_artifacts import ModelArtifactManager, ModelIntegrityError
+
+
+def write(path, data: bytes, mtime_ns: int) -> None:
+    path.write_bytes(data)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_fetch_copies_local_source_into_cache(tmp_path):
+    src = tmp_path / "model.pkl"
+    write(src, b"v1", 1_000_000_000)
+    m = ModelArtifactManager(str(src), tmp_path / "cache")
+    path = m.fetch()
+    assert path.read_bytes() == b"v1"
+    assert path.parent.parent == tmp_path / "cache"
+    assert m.fingerprint() == hashlib.sha256(b"v1").hexdigest()[:16]
+
+
+def test_replacing_local_source_is_picked_up(tmp_path):
+    src = tmp_path / "model.pkl"
+    write(src, b"v1", 1_000_000_000)
+    assert ModelArtifactManager(str(src), tmp_path / "cache").fetch().read_bytes() == b"v1"
+
+    write(src, b"v2", 2_000_000_000)
+    m = ModelArtifactManager(str(src), tmp_path / "cache")
+    assert m.fetch().read_bytes() == b"v2"
+    assert m.fingerprint() == hashlib.sha256(b"v2").hexdigest()[:16]
+
+
+def test_sha256_mismatch_keeps_no_partial_file(tmp_path):
+    src = tmp_path / "model.pkl"
+    src.write_bytes(b"tampered")
+    m = ModelArtifactManager(str(src), tmp_path / "cache", sha256=hashlib.sha256(b"expected").hexdigest())
+    with pytest.raises(ModelIntegrityError):
+        m.fetch()
+    assert not m.path.exists()
+    assert os.listdir(m.dir) == []
+
+
+def test_expected_sha256_selects_version_dir(tmp_path):
+    src = tmp_path / "model.pkl"
+    src.write_bytes(b"v1")
+    digest = hashlib.sha256(b"v1").hexdigest()
+    m = ModelArtifactManager(str(src), tmp_path / "cache", sha256=digest.upper())
+    assert m.version == digest[:12]
+    assert m.fetch().read_bytes() == b"v1"
+    assert m.is_valid()
@@ -0,0 +1,68 @@
+import numpy as np
+
+from prediction_cache import PredictionCache, image_key
+
+
+def value(n_floats: int = 4):
+    return "a", 0, np.zeros(n_floats, dtype=np.float32)   # probs: n_floats * 4 bytes
+
+
+def test_image_key_is_content_hash():
+    assert image_key(b"abc") == image_key(b"abc")
+    assert image_key(b"abc") != image_key(b"abd")
+
+
+def test_hit_miss_counters_and_fingerprint_isolation():
+    cache = PredictionCache(max_entries=8, max_bytes=1 << 20)
+    assert cache.get("m1", "k") is None
+    cache.put("m1", "k", value())
+    assert cache.get("m1", "k")[0] == "a"
+    assert cache.get("m2", "k") is None          # 다른 모델 지문은 다른 항목
+    s = cache.stats()
+    assert (s["hits"], s["misses"], s["entries"]) == (1, 2, 1)
+    assert s["hit_rate"] == 1 / 3
+
+
+def test_get_or_compute_calls_compute_once():
+    cache = PredictionCache()
+    calls = []
+    compute = lambda: calls.append(1) or value()  # noqa: E731
+    cache.get_or_compute("m", "k", compute)
+    cache.get_or_compute("m", "k", compute)
+    assert len(calls) == 1
+
+
+def test_evicts_least_recently_used_by_entry_count():
+    cache = PredictionCache(max_entries=2, max_bytes=1 << 20)
+    cache.put("m", "a", value())
+    cache.put("m", "b", value())
+    cache.get("m", "a")                          # a를 최근 사용으로
+    cache.put("m", "c", value())
+    assert cache.get("m", "b") is None
+    assert cache.get("m", "a") is not None and cache.get("m", "c") is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_evicts_by_byte_budget_and_skips_oversized_items():
+    one = PredictionCache(max_entries=100, max_bytes=10_000)
+    one.put("m", "probe", value(1000))
+    item = one.stats()["bytes"]
+
+    cache = PredictionCache(max_entries=100, max_bytes=2 * item + item // 2)
+    for k in "abc":
+        cache.put("m", k, value(1000))
+    s = cache.stats()
+    assert s["entries"] == 2 and s["bytes"] == 2 * item and s["evictions"] == 1
+    assert cache.get("m", "a") is None
+
+    cache.put("m", "huge", value(10_000))        # 예산보다 큰 항목은 저장하지 않음
+    assert cache.get("m", "huge") is None
+    assert cache.stats()["entries"] == 2
+
+
+def test_put_replaces_existing_entry_without_double_counting():
+    cache = PredictionCache(max_entries=10, max_bytes=1 << 20)
+    cache.put("m", "k", value(10))
+    before = cache.stats()["bytes"]
+    cache.put("m", "k", value(10))
+    assert cache.stats()["bytes"] == before and len(cache) == 1
@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+from render import prob_panel_html, top_k
+
+
+def test_top_k_orders_descending_and_sums_the_rest():
+    idx, rest = top_k([0.1, 0.5, 0.15, 0.25], 2)
+    assert idx.tolist() == [1, 3]
+    assert rest == pytest.approx(0.25)
+
+
+@pytest.mark.parametrize("k", [None, 0, 4, 10])
+def test_top_k_without_limit_sorts_everything(k):
+    idx, rest = top_k([0.1, 0.5, 0.15, 0.25], k)
+    assert idx.tolist() == [1, 3, 2, 0]
+    assert rest == 0.0
+
+
+def test_top_k_breaks_ties_by_index_at_the_boundary():
+    p = np.array([0.1, 0.2, 0.2, 0.3, 0.2])
+    assert top_k(p, 2)[0].tolist() == [3, 1]
+    assert top_k(p, 3)[0].tolist() == [3, 1, 2]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_top_k_matches_stable_full_sort(seed):
+    rng = np.random.default_rng(seed)
+    p = rng.integers(0, 5, 1000) / 10            # 동점이 많은 분포
+    for k in (1, 7, 50, 999):
+        idx, rest = top_k(p, k)
+        expected = np.argsort(-p, kind="stable")[:k]
+        assert idx.tolist() == expected.tolist()
+        assert rest == pytest.approx(p.sum() - p[expected].sum())
+
+
+def test_prob_panel_adds_others_row_and_escapes_labels():
+    html = prob_panel_html(["<a>", "b", "c"], [0.6, 0.3, 0.1], k=1, highlight="<a>")
+    assert html.count('class="prob-card"') == 2
+    assert "&lt;a&gt;" in html and "<a>" not in html
+    assert "기타 2개 라벨" in html and "40.00%" in html
+    assert "\n" not in html
+
+
+def test_prob_panel_has_no_others_row_when_everything_fits():
+    html = prob_panel_html(["a", "b", "c"], [0.6, 0.3, 0.1], k=10)
+    assert html.count('class="prob-card"') == 3
+    assert "기타" not in html
@@ -0,0 +1,72 @@
+import cv2
+import numpy as np
+import pytest
+
+from preprocess import PreprocessSpec
+from video_infer import iter_frames, segments_from_probs, smooth_probs
+
+
+@pytest.fixture
+def clip(tmp_path) -> str:
+    """10fps, 2초짜리 합성 영상: 앞 1초 빨강, 뒤 1초 파랑 (160x120)."""
+    path = str(tmp_path / "clip.avi")
+    out = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), 10.0, (160, 120))
+    for i in range(20):
+        out.write(np.full((120, 160, 3), (40, 40, 220) if i < 10 else (220, 40, 40), np.uint8))
+    out.release()
+    return path
+
+
+def test_smooth_probs_uses_time_window():
+    probs = np.array([[1, 0], [0, 1], [1, 0], [1, 0]], dtype=np.float32)
+    times = np.array([0.0, 1.0, 2.0, 10.0])
+    out = smooth_probs(probs, times, window_s=2.0)
+    np.testing.assert_allclose(out[:3], [[0.5, 0.5], [2 / 3, 1 / 3], [0.5, 0.5]], rtol=1e-6)
+    np.testing.assert_allclose(out[3], [1, 0])   # 창 안에 자기 자신뿐
+    assert out.dtype == np.float32
+    assert smooth_probs(probs, times, window_s=0) is probs
+
+
+def test_segments_group_runs():
+    probs = np.array([[0.9, 0.1], [0.7, 0.3], [0.2, 0.8], [0.4, 0.6]])
+    seg = segments_from_probs(np.arange(4.0), probs, ["a", "b"], duration=4.5)
+    assert seg[["start", "end", "label"]].values.tolist() == [[0.0, 2.0, "a"], [2.0, 4.5, "b"]]
+    assert seg["confidence"].tolist() == pytest.approx([0.8, 0.7])
+
+
+def test_segments_merge_short_run_into_previous():
+    probs = np.array([[0.9, 0.1], [0.9, 0.1], [0.2, 0.8], [0.9, 0.1], [0.9, 0.1]])
+    seg = segments_from_probs(np.arange(5.0), probs, ["a", "b"], min_segment_s=1.5)
+    assert seg["label"].tolist() == ["a"]
+    assert (seg["start"][0], seg["end"][0]) == (0.0, 5.0)
+    # 합쳐진 구간의 확률도 최종 라벨(a) 기준
+    assert seg["confidence"][0] == pytest.approx(0.76)
+
+
+def test_segments_merge_leading_short_run_into_next():
+    probs = np.array([[0.2, 0.8], [0.9, 0.1], [0.9, 0.1], [0.9, 0.1]])
+    seg = segments_from_probs(np.arange(4.0), probs, ["a", "b"], min_segment_s=1.5)
+    assert seg["label"].tolist() == ["a"]
+
+
+def test_segments_empty():
+    seg = segments_from_probs(np.array([]), np.zeros((0, 2)), ["a", "b"])
+    assert seg.empty and list(seg.columns) == ["start", "end", "label", "confidence"]
+
+
+def test_iter_frames_fps_sampling(clip):
+    frames = list(iter_frames(clip, PreprocessSpec(size=(32, 32)), sample_fps=2.0))
+    assert [t for t, _ in frames] == pytest.approx([0.0, 0.5, 1.0, 1.5])
+    assert all(im.size == (32, 32) for _, im in frames)
+    r, _, b = np.asarray(frames[0][1]).mean(axis=(0, 1))
+    assert r > b   # BGR -> RGB 변환
+
+
+def test_iter_frames_scene_sampling(clip):
+    times = [t for t, _ in iter_frames(clip, sample_fps=10.0, mode="scene")]
+    assert times == pytest.approx([0.0, 1.0])
+
+
+def test_iter_frames_bad_path(tmp_path):
+    with pytest.raises(ValueError, match="cannot open video"):
+        next(iter_frames(str(tmp_path / "missing.mp4")))
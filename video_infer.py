@@ -0,0 +1,250 @@
+# video_infer.py
+# 녹화 영상 분류: 프레임 샘플링 -> 배치 추론 -> 시간축 스무딩 -> 구간별 라벨 타임라인.
+# - 업로드는 청크 단위로 임시 파일에 기록하고 cv2.VideoCapture로 스트리밍 디코딩 (전체를 메모리에 올리지 않음)
+# - 고정 간격(sample_fps) 또는 장면 전환(scene) 샘플링
+# - 디코딩 스레드와 추론(메인 스레드)을 큐로 연결해 겹쳐서 실행
+import os
+import queue
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator
+
+import cv2
+import numpy as np
+import pandas as pd
+from PIL import Image
+
+from preprocess import PreprocessSpec, resize_like_fastai
+
+_END = object()
+
+
+@dataclass
+class VideoResult:
+    times: np.ndarray                 # (T,) 샘플 프레임 시각(초)
+    probs: np.ndarray                 # (T, C) 프레임별 확률
+    smoothed: np.ndarray              # (T, C) 스무딩된 확률
+    labels: list[str]
+    segments: pd.DataFrame            # start, end, label, confidence
+    stats: dict[str, float] = field(default_factory=dict)
+
+    def probs_frame(self, smoothed: bool = True) -> pd.DataFrame:
+        return pd.DataFrame(self.smoothed if smoothed else self.probs, index=pd.Index(self.times, name="time_s"),
+                            columns=self.labels)
+
+
+def spool_upload(uploaded: Any, suffix: str = ".mp4", chunk_size: int = 1 << 20) -> str:
+    """업로드 파일을 청크 단위로 임시 파일에 기록하고 경로 반환 (호출자가 삭제)."""
+    fd, path = tempfile.mkstemp(suffix=suffix, prefix="video-")
+    uploaded.seek(0)
+    with os.fdopen(fd, "wb") as fh:
+        for chunk in iter(lambda: uploaded.read(chunk_size), b""):
+            fh.write(chunk)
+    return path
+
+
+def _to_model_image(bgr: np.ndarray, spec: PreprocessSpec | None) -> Image.Image:
+    """BGR 프레임 -> 모델 입력 PIL. 큰 프레임은 cv2(INTER_AREA)로 먼저 줄임."""
+    if spec is not None and spec.min_decode_size is not None:
+        h, w = bgr.shape[:2]
+        tw, th = spec.min_decode_size
+        s = max(tw / w, th / h)
+        if s < 0.5:
+            bgr = cv2.resize(bgr, (max(tw, round(w * s)), max(th, round(h * s))), interpolation=cv2.INTER_AREA)
+    pil = Image.fromarray(cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB))
+    return resize_like_fastai(pil, spec) if spec is not None else pil
+
+
+def _scene_signature(bgr: np.ndarray) -> np.ndarray:
+    small = cv2.resize(bgr, (32, 32), interpolation=cv2.INTER_AREA)
+    return cv2.cvtColor(small, cv2.COLOR_BGR2GRAY).astype(np.float32)
+
+
+def iter_frames(
+    path: str,
+    spec: PreprocessSpec | None = None,
+    sample_fps: float = 2.0,
+    mode: str = "fps",
+    scene_threshold: float = 12.0,
+    max_gap_s: float = 5.0,
+) -> Iterator[tuple[float, Image.Image]]:
+    """(시각, 모델 입력 이미지)를 생성.
+
+    mode="fps"  : sample_fps 간격으로 샘플
+    mode="scene": sample_fps 간격의 후보 중 이전 샘플과 평균 밝기 차이가 scene_threshold 이상이거나
+                  max_gap_s가 지난 프레임만 샘플
+    건너뛰는 프레임은 grab()만 하고 색 변환/복사를 하지 않습니다.
+    """
+    cap = cv2.VideoCapture(path)
+    if not cap.isOpened():
+        raise ValueError(f"cannot open video: {path}")
+    fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+    step = max(1, round(fps / max(sample_fps, 1e-6)))
+    last_sig, last_t = None, -np.inf
+    idx = 0
+    try:
+        while cap.grab():
+            if idx % step == 0:
+                ok, bgr = cap.retrieve()
+                if not ok:
+                    break
+                t = idx / fps
+                if mode == "scene":
+                    sig = _scene_signature(bgr)
+                    changed = last_sig is None or float(np.abs(sig - last_sig).mean()) >= scene_threshold
+                    if not changed and t - last_t < max_gap_s:
+                        idx += 1
+                        continue
+                    last_sig = sig
+                last_t = t
+                yield t, _to_model_image(bgr, spec)
+            idx += 1
+    finally:
+        cap.release()
+
+
+def video_info(path: str) -> tuple[float, int]:
+    """(fps, 전체 프레임 수). 컨테이너에 정보가 없으면 (30.0, 0)."""
+    cap = cv2.VideoCapture(path)
+    try:
+        return cap.get(cv2.CAP_PROP_FPS) or 30.0, int(cap.get(cv2.CAP_PROP_FRAME_COUNT) or 0)
+    finally:
+        cap.release()
+
+
+def smooth_probs(probs: np.ndarray, times: np.ndarray, window_s: float = 2.0) -> np.ndarray:
+    """시각 기준 중앙 이동평균: 각 샘플을 ±window_s/2 안의 샘플 평균으로 바꿈.
+
+    샘플 간격이 일정하지 않은 장면 전환 모드에서도 같은 의미를 갖도록 프레임 수가 아닌 초 단위로 계산합니다.
+    """
+    if window_s <= 0 or len(probs) == 0:
+        return probs
+    lo = np.searchsorted(times, times - window_s / 2, side="left")
+    hi = np.searchsorted(times, times + window_s / 2, side="right")
+    csum = np.vstack([np.zeros((1, probs.shape[1])), np.cumsum(probs, axis=0, dtype=np.float64)])
+    return ((csum[hi] - csum[lo]) / (hi - lo)[:, None]).astype(probs.dtype)
+
+
+def segments_from_probs(times: np.ndarray, probs: np.ndarray, labels: list[str],
+                        min_segment_s: float = 0.0, duration: float | None = None) -> pd.DataFrame:
+    """같은 top-1 라벨이 이어지는 구간을 묶음. min_segment_s보다 짧은 구간은 앞(없으면 뒤) 구간에 합침.
+
+    duration(영상 길이, 초)을 주면 마지막 구간의 끝으로 사용합니다.
+    """
+    cols = ["start", "end", "label", "confidence"]
+    if len(times) == 0:
+        return pd.DataFrame(columns=cols)
+    top = probs.argmax(axis=1)
+    # 각 샘플은 다음 샘플 직전까지를 대표
+    if duration is None:
+        duration = times[-1] + (times[-1] - times[-2] if len(times) > 1 else 0.0)
+    ends = np.append(times[1:], max(duration, times[-1]))
+
+    def runs(cls: np.ndarray) -> list[tuple[int, int]]:
+        cut = np.flatnonzero(np.diff(cls)) + 1
+        starts = np.concatenate([[0], cut])
+        return list(zip(starts, np.append(cut, len(cls))))
+
+    if min_segment_s > 0:
+        while True:
+            rs = runs(top)
+            short = [k for k, (i, j) in enumerate(rs) if ends[j - 1] - times[i] < min_segment_s]
+            if not short or len(rs) == 1:
+                break
+            k = short[0]
+            i, j = rs[k]
+            top[i:j] = top[rs[k - 1][0]] if k > 0 else top[rs[k + 1][0]]
+    # 합친 뒤의 라벨 기준 확률 (짧은 구간의 샘플도 합쳐진 라벨의 확률로 평균)
+    conf = probs[np.arange(len(top)), top]
+    return pd.DataFrame(
+        [(float(times[i]), float(ends[j - 1]), labels[int(top[i])], float(conf[i:j].mean())) for i, j in runs(top)],
+        columns=cols,
+    )
+
+
+def classify_video(
+    engine,
+    path: str,
+    sample_fps: float = 2.0,
+    mode: str = "fps",
+    batch_size: int = 32,
+    smooth_s: float = 2.0,
+    min_segment_s: float = 1.0,
+    scene_threshold: float = 12.0,
+    progress: Callable[[float, float], None] | None = None,
+) -> VideoResult:
+    """영상 전체를 분류. progress(현재 영상 시각(초), 처리 frames/sec)가 배치마다 호출됩니다."""
+    spec = getattr(engine, "spec", None)
+    frames: queue.Queue = queue.Queue(maxsize=batch_size * 2)
+    stop = threading.Event()
+    error: list[BaseException] = []
+
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                frames.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def decode() -> None:
+        try:
+            for item in iter_frames(path, spec, sample_fps, mode, scene_threshold):
+                if not put(item):
+                    return
+        except BaseException as e:
+            error.append(e)
+        finally:
+            put(_END)
+
+    t0 = time.perf_counter()
+    th = threading.Thread(target=decode, name="video-decode", daemon=True)
+    th.start()
+    times: list[float] = []
+    chunks: list[np.ndarray] = []
+    infer_s = 0.0
+    done = False
+    try:
+        while not done:
+            batch = []
+            item = frames.get()
+            while item is not _END:
+                batch.append(item)
+                if len(batch) >= batch_size:
+                    break
+                item = frames.get()
+            done = item is _END
+            if batch:
+                t = time.perf_counter()
+                chunks.append(np.asarray(engine.predict_batch([im for _, im in batch])))
+                infer_s += time.perf_counter() - t
+                times.extend(ts for ts, _ in batch)
+                if progress is not None:
+                    progress(times[-1], len(times) / max(time.perf_counter() - t0, 1e-9))
+    finally:
+        stop.set()   # 추론 쪽에서 예외가 나도 디코딩 스레드가 멈추도록
+        th.join()
+    if error:
+        raise error[0]
+    wall = time.perf_counter() - t0
+
+    labels = list(engine.labels)
+    probs = np.concatenate(chunks) if chunks else np.empty((0, len(labels)), dtype=np.float32)
+    t_arr = np.asarray(times, dtype=np.float64)
+    smoothed = smooth_probs(probs, t_arr, smooth_s)
+    fps, n_frames = video_info(path)
+    return VideoResult(
+        times=t_arr, probs=probs, smoothed=smoothed, labels=labels,
+        segments=segments_from_probs(t_arr, smoothed, labels, min_segment_s,
+                                     duration=n_frames / fps if n_frames else None),
+        stats={
+            "frames": float(len(times)),
+            "total_sec": wall,
+            "infer_sec": infer_s,
+            "frames_per_sec": len(times) / wall if wall > 0 else 0.0,
+            "infer_frames_per_sec": len(times) / infer_s if infer_s > 0 else 0.0,
+        },
+    )